@@ -0,0 +1,13 @@
+"""
+Production entry point serving the app through an ASGI server
+
+Views run as coroutines on the event loop of each worker, so simultaneous
+viewers waiting for the weather API do not need a thread each.
+
+Run with:
+    uvicorn asgi:app --host 0.0.0.0 --port 5000 --workers 4
+"""
+
+from wind_app import create_asgi_app
+
+app = create_asgi_app()
@@ -0,0 +1,96 @@
+"""
+Headless fleet reporting for recorded wind speed snapshots
+
+Streams snapshot files (CSV or Parquet with ID, Timestamp and Wind speed columns)
+through the dashboard power calculations and writes country and fleet summaries
+as Parquet files.
+
+Run with:
+    uv run python -m report snapshots/*.csv --output-dir reports --workers 4
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from wind_app.services.fleet_report import (
+    build_reports,
+    check_unique_farm_ids,
+    summarize_snapshot_file,
+)
+from wind_app.services.wind_farm_service.excel import WindFarmServiceExcel
+from wind_app.utils import log
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compute country and fleet reports for wind speed snapshots"
+    )
+    parser.add_argument(
+        "snapshots", nargs="+", help="CSV or Parquet files with wind speed snapshots"
+    )
+    parser.add_argument(
+        "--farms",
+        default="data/windfarms.xlsx",
+        help="Excel file with wind farm data (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default="reports",
+        help="Directory for the Parquet reports (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=100_000,
+        help="Rows processed at once per file (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes summarizing files in parallel (default: %(default)s)",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    arguments = parse_arguments()
+
+    wind_farm_data = WindFarmServiceExcel(arguments.farms).load_wind_farm_data()
+    if wind_farm_data.empty:
+        raise SystemExit(f"No wind farm data loaded from {arguments.farms}")
+
+    # Fail before any snapshot file is processed
+    try:
+        check_unique_farm_ids(wind_farm_data)
+    except ValueError as error:
+        raise SystemExit(f"{arguments.farms}: {error}") from error
+
+    summarize = partial(
+        summarize_snapshot_file,
+        wind_farm_data=wind_farm_data,
+        chunk_size=arguments.chunk_size,
+    )
+
+    if arguments.workers > 1:
+        with ProcessPoolExecutor(max_workers=arguments.workers) as executor:
+            partials = list(executor.map(summarize, arguments.snapshots))
+    else:
+        partials = [summarize(path) for path in arguments.snapshots]
+
+    country_report, fleet_report = build_reports(partials)
+
+    os.makedirs(arguments.output_dir, exist_ok=True)
+    country_report_path = os.path.join(arguments.output_dir, "country_report.parquet")
+    fleet_report_path = os.path.join(arguments.output_dir, "fleet_report.parquet")
+    country_report.to_parquet(country_report_path, index=False)
+    fleet_report.to_parquet(fleet_report_path, index=False)
+
+    log(f"✅ Country report written to: {country_report_path}")
+    log(f"✅ Fleet report written to: {fleet_report_path}")
+
+
+if __name__ == "__main__":
+    main()
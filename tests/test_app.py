@@ -0,0 +1,29 @@
+import subprocess
+import sys
+
+IMPORT_TIME_BUDGET_SECONDS = 1.5
+
+HEAVY_DEPENDENCIES = ["pandas", "numpy", "scipy", "openpyxl", "httpx"]
+
+
+def test_create_app_is_fast_and_lightweight() -> None:
+    """Creating the app must not import services nor their heavy dependencies"""
+    script = f"""
+import sys
+import time
+
+start = time.perf_counter()
+from wind_app import create_app
+create_app()
+elapsed = time.perf_counter() - start
+
+loaded = [name for name in {HEAVY_DEPENDENCIES!r} if name in sys.modules]
+assert not loaded, f"Heavy dependencies imported at startup: {{loaded}}"
+assert elapsed < {IMPORT_TIME_BUDGET_SECONDS}, f"Startup took {{elapsed:.2f}} s"
+"""
+    # Run in a fresh interpreter as the test session has everything imported already
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True
+    )
+
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,100 @@
+import pytest
+from flask.testing import FlaskClient
+from pytest_mock import MockerFixture
+
+from wind_app import create_app, profiling
+
+
+@pytest.fixture
+def settings(mocker: MockerFixture) -> profiling.ProfilingSettings:
+    settings = profiling.ProfilingSettings()
+    settings.token = "secret"
+    settings.sample_rate = 0
+    mocker.patch.object(profiling, "settings", settings)
+    return settings
+
+
+@pytest.fixture
+def profile_store(mocker: MockerFixture) -> profiling.ProfileStore:
+    profile_store = profiling.ProfileStore(max_profiles=2)
+    mocker.patch.object(profiling, "profile_store", profile_store)
+    return profile_store
+
+
+def test_stages_are_not_profiled_outside_profiled_request() -> None:
+    assert profiling.profile_stage("load") is profiling.profile_stage("render")
+
+
+def test_profile_request_records_stages(
+    profile_store: profiling.ProfileStore,
+) -> None:
+    with profiling.profile_request("/home", enabled=True) as profile:
+        with profiling.profile_stage("load"):
+            sum(range(1000))
+        with profiling.profile_stage("render"):
+            pass
+
+    assert profile_store.get_all() == [profile]
+    assert [stage["name"] for stage in profile.stages] == ["load", "render"]
+    assert profile.stages[0]["duration_seconds"] >= 0
+    assert "function calls" in profile.stages[0]["stats"]
+    assert profile.duration_seconds >= 0
+
+
+def test_disabled_profile_request_stores_nothing(
+    profile_store: profiling.ProfileStore,
+) -> None:
+    with profiling.profile_request("/home", enabled=False) as profile:
+        with profiling.profile_stage("load"):
+            pass
+
+    assert profile is None
+    assert profile_store.get_all() == []
+
+
+def test_profile_store_is_bounded(profile_store: profiling.ProfileStore) -> None:
+    for path in ["/first", "/second", "/third"]:
+        with profiling.profile_request(path, enabled=True):
+            pass
+
+    assert [profile.path for profile in profile_store.get_all()] == [
+        "/third",
+        "/second",
+    ]
+
+
+def test_is_profiling_requested(settings: profiling.ProfilingSettings) -> None:
+    assert profiling.is_profiling_requested({"X-Profile-Token": "secret"})
+    assert not profiling.is_profiling_requested({"X-Profile-Token": "wrong"})
+    assert not profiling.is_profiling_requested({})
+
+    settings.sample_rate = 1
+    assert profiling.is_profiling_requested({})
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"), [("0.25", 0.25), ("often", 0.0), ("2", 0.0), ("nan", 0.0)]
+)
+def test_sample_rate_is_parsed_defensively(
+    monkeypatch: pytest.MonkeyPatch, value: str, expected: float
+) -> None:
+    monkeypatch.setenv("WIND_APP_PROFILE_SAMPLE_RATE", value)
+
+    assert profiling.ProfilingSettings().sample_rate == expected
+
+
+def test_profiles_endpoint(
+    settings: profiling.ProfilingSettings, profile_store: profiling.ProfileStore
+) -> None:
+    client: FlaskClient = create_app().test_client()
+    with profiling.profile_request("/home", enabled=True):
+        with profiling.profile_stage("render"):
+            pass
+
+    assert client.get("/_profiles").status_code == 404
+
+    response = client.get("/_profiles", headers={"X-Profile-Token": "secret"})
+
+    assert response.status_code == 200
+    assert response.json["profiles"][0]["path"] == "/home"
+    assert response.json["profiles"][0]["stages"][0]["name"] == "render"
@@ -0,0 +1,61 @@
+import asyncio
+import threading
+
+from pytest_mock import MockerFixture
+
+from wind_app import create_asgi_app
+from wind_app.routes import home
+
+
+def test_probes() -> None:
+    async def get_probes() -> tuple[int, int]:
+        client = create_asgi_app().test_client()
+        liveness = await client.get("/healthz")
+        readiness = await client.get("/readyz")
+        return liveness.status_code, readiness.status_code
+
+    assert asyncio.run(get_probes()) == (200, 200)
+
+
+def test_viewers_waiting_for_weather_do_not_hold_threads(
+    mocker: MockerFixture,
+) -> None:
+    weather_available = asyncio.Event()
+
+    async def get_wind_speeds(coordinates, **_) -> list[float]:
+        await weather_available.wait()
+        return [10.0] * len(coordinates)
+
+    weather_service = mocker.Mock()
+    weather_service.get_current_wind_speeds_async = mocker.AsyncMock(
+        side_effect=get_wind_speeds
+    )
+    mocker.patch.object(home, "get_weather_service", return_value=weather_service)
+
+    async def serve_viewers() -> tuple[int, int, list[int]]:
+        client = create_asgi_app().test_client()
+        threads_before = threading.active_count()
+
+        viewers = [asyncio.create_task(client.get("/")) for _ in range(50)]
+        while not weather_service.get_current_wind_speeds_async.await_count:
+            await asyncio.sleep(0.01)
+
+        # All viewers wait for the weather API, yet probes are answered at once
+        liveness = await asyncio.wait_for(client.get("/healthz"), timeout=1)
+        threads_while_waiting = threading.active_count() - threads_before
+
+        weather_available.set()
+        responses = await asyncio.gather(*viewers)
+        return (
+            liveness.status_code,
+            threads_while_waiting,
+            [response.status_code for response in responses],
+        )
+
+    liveness_status, extra_threads, statuses = asyncio.run(serve_viewers())
+
+    assert liveness_status == 200
+    assert extra_threads < 5  # Only the loop's worker threads, not one per viewer
+    assert statuses == [200] * 50
+    # The viewers shared one dashboard computation
+    assert weather_service.get_current_wind_speeds_async.await_count == 1
@@ -0,0 +1,125 @@
+from pathlib import Path
+
+import pytest
+from flask.testing import FlaskClient
+from pytest_mock import MockerFixture
+
+from wind_app import create_app
+from wind_app.routes import home
+from wind_app.services.circuit_breaker import CircuitBreaker
+from wind_app.services.status import DashboardStatus
+from wind_app.services.weather_cache import WeatherCache
+
+
+@pytest.fixture
+def client() -> FlaskClient:
+    return create_app().test_client()
+
+
+@pytest.fixture
+def breaker(mocker: MockerFixture) -> CircuitBreaker:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout_seconds=60)
+    mocker.patch.object(home, "weather_api_breaker", breaker)
+    return breaker
+
+
+@pytest.fixture
+def status(mocker: MockerFixture) -> DashboardStatus:
+    status = DashboardStatus()
+    mocker.patch.object(home, "dashboard_status", status)
+    return status
+
+
+def test_liveness(client: FlaskClient) -> None:
+    response = client.get("/healthz")
+
+    assert response.status_code == 200
+    assert response.json == {"status": "alive"}
+
+
+def test_readiness_without_snapshot(
+    client: FlaskClient, breaker: CircuitBreaker, status: DashboardStatus
+) -> None:
+    response = client.get("/readyz")
+
+    assert response.status_code == 200
+    assert response.json["status"] == "ready"
+    assert response.json["snapshot_age_seconds"] is None
+    assert response.json["weather_api_breaker"] == "closed"
+
+
+def test_readiness_reports_snapshot_and_cache(
+    mocker: MockerFixture,
+    tmp_path: Path,
+    client: FlaskClient,
+    breaker: CircuitBreaker,
+    status: DashboardStatus,
+) -> None:
+    weather_cache = WeatherCache(str(tmp_path / "cache.sqlite3"), max_entries=4)
+    weather_cache.set(56.6, 11.21, 10.5)
+    mocker.patch.object(home, "_weather_cache", weather_cache)
+    status.record_refresh(1.5)
+
+    response = client.get("/readyz")
+
+    assert response.status_code == 200
+    assert response.json["snapshot_age_seconds"] >= 0
+    assert response.json["last_refresh_duration_seconds"] == 1.5
+    assert response.json["weather_cache"] == {
+        "entries": 1,
+        "max_entries": 4,
+        "fill_level": 0.25,
+    }
+
+
+def test_not_ready_when_weather_api_fails_without_snapshot(
+    mocker: MockerFixture,
+    client: FlaskClient,
+    breaker: CircuitBreaker,
+    status: DashboardStatus,
+) -> None:
+    breaker.record_failure()
+
+    response = client.get("/readyz")
+
+    assert response.status_code == 503
+    assert response.json["status"] == "not_ready"
+    assert response.json["weather_api_breaker"] == "open"
+
+    # Cached wind speeds of a recent snapshot are still served
+    status.record_refresh(1.0)
+    response = client.get("/readyz")
+    assert response.status_code == 200
+    assert response.json["weather_api_breaker"] == "open"
+
+    # Not once the snapshot is older than the cached wind speeds
+    mocker.patch.object(
+        DashboardStatus,
+        "snapshot_age_seconds",
+        new_callable=mocker.PropertyMock,
+        return_value=home.MAX_SNAPSHOT_AGE_SECONDS + 1,
+    )
+    assert client.get("/readyz").status_code == 503
+
+
+@pytest.mark.parametrize(
+    ("wind_speed", "is_refresh_recorded"), [(None, False), (10.0, True)]
+)
+def test_refresh_is_recorded_only_with_weather_data(
+    mocker: MockerFixture,
+    client: FlaskClient,
+    status: DashboardStatus,
+    wind_speed: float | None,
+    is_refresh_recorded: bool,
+) -> None:
+    weather_service = mocker.Mock()
+    weather_service.get_current_wind_speeds_async = mocker.AsyncMock(
+        side_effect=lambda coordinates, **_: [wind_speed] * len(coordinates)
+    )
+    mocker.patch.object(home, "get_weather_service", return_value=weather_service)
+
+    response = client.get("/")
+
+    assert response.status_code == 200
+    assert "Anholt" in response.text  # Farms are shown in both cases
+    assert (status.snapshot_age_seconds is not None) == is_refresh_recorded
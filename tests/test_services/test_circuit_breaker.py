@@ -0,0 +1,51 @@
+from unittest.mock import MagicMock
+
+import httpx
+from pytest_mock import MockerFixture
+
+from wind_app.services.circuit_breaker import CircuitBreaker
+from wind_app.services.weather_service import WeatherService
+
+
+def test_breaker_opens_after_consecutive_failures() -> None:
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout_seconds=60)
+
+    breaker.record_failure()
+    breaker.record_success()  # Resets the count
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    assert breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow_request()
+
+
+def test_breaker_lets_one_trial_request_through(mocker: MockerFixture) -> None:
+    monotonic = mocker.patch("wind_app.services.circuit_breaker.time.monotonic")
+    monotonic.return_value = 100.0
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout_seconds=30)
+    breaker.record_failure()
+
+    monotonic.return_value = 131.0
+    assert breaker.state == "half_open"
+    assert breaker.allow_request()
+    assert not breaker.allow_request()  # Only one trial at a time
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_weather_service_skips_requests_when_open() -> None:
+    mock_http_client = MagicMock()
+    mock_http_client.get.side_effect = httpx.ConnectError("connection refused")
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout_seconds=60)
+    weather_service = WeatherService(
+        http_client=mock_http_client, circuit_breaker=breaker
+    )
+
+    for _ in range(4):
+        assert weather_service.get_current_wind_speed(56.6, 11.21) is None
+
+    assert mock_http_client.get.call_count == 2
+    assert breaker.state == "open"
@@ -0,0 +1,95 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from wind_app.services.fleet_report import build_reports, summarize_snapshot_file
+
+
+@pytest.fixture
+def wind_farm_data() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "ID": ["ANH", "AVD", "HOR"],
+            "Name": ["Anholt", "Avedøre", "Hornsea"],
+            "Overall capacity": [400.0, 7.2, 1218.0],
+            "Country": ["Denmark", "Denmark", "United Kingdom"],
+        }
+    )
+
+
+@pytest.fixture
+def snapshots() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "ID": ["ANH", "AVD", "HOR", "ANH", "AVD", "HOR", "UNKNOWN"],
+            "Timestamp": pd.to_datetime(
+                ["2025-01-01 00:00"] * 3
+                + ["2025-01-01 01:00"] * 3
+                + ["2025-01-01 00:00"]
+            ),
+            "Wind speed": [10.0, 8.0, 12.0, 4.0, None, 30.0, 10.0],
+        }
+    )
+
+
+def test_summarize_csv_in_chunks(
+    tmp_path: Path, wind_farm_data: pd.DataFrame, snapshots: pd.DataFrame
+) -> None:
+    path = tmp_path / "snapshots.csv"
+    snapshots.to_csv(path, index=False)
+
+    partial = summarize_snapshot_file(str(path), wind_farm_data, chunk_size=2)
+    country_report, fleet_report = build_reports([partial])
+
+    denmark = country_report[country_report["Country"] == "Denmark"].set_index(
+        "Timestamp"
+    )
+    first, second = denmark.index
+    assert denmark.loc[first, "total_generation"] == pytest.approx(360 + 4.32)
+    assert denmark.loc[first, "total_capacity"] == pytest.approx(407.2)
+    assert denmark.loc[first, "farms_reporting"] == 2
+    # Avedøre had no wind speed at 01:00
+    assert denmark.loc[second, "total_generation"] == pytest.approx(40)
+    assert denmark.loc[second, "capacity_factor"] == pytest.approx(10)
+
+    fleet = fleet_report.set_index("Timestamp")
+    assert fleet.loc[first, "total_generation"] == pytest.approx(360 + 4.32 + 1218)
+    assert fleet.loc[second, "total_generation"] == pytest.approx(40)  # Hornsea off
+    assert fleet.loc[first, "co2_avoided"] == pytest.approx((360 + 4.32 + 1218) * 0.82)
+
+
+def test_reports_merge_files(
+    tmp_path: Path, wind_farm_data: pd.DataFrame, snapshots: pd.DataFrame
+) -> None:
+    csv_path = tmp_path / "first.csv"
+    parquet_path = tmp_path / "second.parquet"
+    snapshots.iloc[:2].to_csv(csv_path, index=False)
+    snapshots.iloc[2:3].to_parquet(parquet_path, index=False)
+
+    partials = [
+        summarize_snapshot_file(str(path), wind_farm_data)
+        for path in [csv_path, parquet_path]
+    ]
+    _, fleet_report = build_reports(partials)
+
+    assert len(fleet_report) == 1
+    assert fleet_report["farms_reporting"].iloc[0] == 3
+    assert fleet_report["total_capacity"].iloc[0] == pytest.approx(1625.2)
+
+
+def test_unsupported_format(tmp_path: Path, wind_farm_data: pd.DataFrame) -> None:
+    with pytest.raises(ValueError, match="Unsupported"):
+        summarize_snapshot_file(str(tmp_path / "snapshots.json"), wind_farm_data)
+
+
+def test_duplicated_farm_ids_are_rejected(
+    tmp_path: Path, wind_farm_data: pd.DataFrame, snapshots: pd.DataFrame
+) -> None:
+    path = tmp_path / "snapshots.csv"
+    snapshots.to_csv(path, index=False)
+    # Two farms share an ID, like Horns Rev 1 and Hornsea 1 in the real data
+    wind_farm_data.loc[2, "ID"] = "ANH"
+
+    with pytest.raises(ValueError, match="found duplicates: ANH"):
+        summarize_snapshot_file(str(path), wind_farm_data)
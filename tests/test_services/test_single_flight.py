@@ -0,0 +1,161 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from wind_app.services.single_flight import SingleFlight
+
+
+def test_concurrent_calls_share_one_computation() -> None:
+    single_flight = SingleFlight()
+    calls = []
+    started = threading.Event()
+
+    def compute() -> str:
+        calls.append(1)
+        started.set()
+        time.sleep(0.1)
+        return "dashboard"
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        leader = executor.submit(single_flight.do, "key", compute)
+        started.wait()
+        followers = [
+            executor.submit(single_flight.do, "key", compute) for _ in range(4)
+        ]
+        results = [leader.result()] + [follower.result() for follower in followers]
+
+    assert results == ["dashboard"] * 5
+    assert len(calls) == 1
+    assert single_flight.in_flight() == 0
+
+
+def test_calls_are_not_cached() -> None:
+    single_flight = SingleFlight()
+    calls = []
+
+    for _ in range(3):
+        single_flight.do("key", lambda: calls.append(1))
+
+    assert len(calls) == 3
+
+
+def test_errors_are_shared() -> None:
+    single_flight = SingleFlight()
+
+    def fail() -> None:
+        raise ValueError("upstream failed")
+
+    with pytest.raises(ValueError, match="upstream failed"):
+        single_flight.do("key", fail)
+
+    # The failed call does not block the next one
+    assert single_flight.do("key", lambda: 42) == 42
+
+
+def test_concurrent_coroutines_share_one_computation() -> None:
+    single_flight = SingleFlight()
+    calls = []
+
+    async def compute(key: str) -> str:
+        calls.append(key)
+        await asyncio.sleep(0.05)
+        return key.upper()
+
+    async def run() -> list[str]:
+        return await asyncio.gather(
+            *(
+                single_flight.do_async(key, lambda key=key: compute(key))
+                for key in ["a", "a", "b", "a", "b"]
+            )
+        )
+
+    assert asyncio.run(run()) == ["A", "A", "B", "A", "B"]
+    assert sorted(calls) == ["a", "b"]
+
+
+def test_coroutine_follows_call_from_another_thread() -> None:
+    single_flight = SingleFlight()
+    started = threading.Event()
+    calls = []
+
+    def compute() -> int:
+        calls.append(1)
+        started.set()
+        time.sleep(0.1)
+        return 7
+
+    async def follow() -> int:
+        async def never_called() -> int:
+            raise AssertionError("follower should not compute")
+
+        return await single_flight.do_async("key", never_called)
+
+    leader = threading.Thread(target=single_flight.do, args=("key", compute))
+    leader.start()
+    started.wait()
+
+    assert asyncio.run(follow()) == 7
+    leader.join()
+    assert len(calls) == 1
+
+
+def test_interrupted_leader_lets_followers_retry() -> None:
+    single_flight = SingleFlight()
+    started = threading.Event()
+    calls = []
+
+    def interrupted() -> int:
+        calls.append("leader")
+        started.set()
+        time.sleep(0.1)
+        raise KeyboardInterrupt
+
+    def compute() -> int:
+        calls.append("follower")
+        return 7
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+
+        def lead() -> None:
+            with pytest.raises(KeyboardInterrupt):
+                single_flight.do("key", interrupted)
+
+        leader = executor.submit(lead)
+        started.wait()
+
+        # The follower is not interrupted, it computes the result itself
+        assert single_flight.do("key", compute) == 7
+        leader.result()
+
+    assert calls == ["leader", "follower"]
+
+
+def test_cancelled_leader_lets_followers_retry() -> None:
+    single_flight = SingleFlight()
+    calls = []
+
+    async def compute(name: str) -> str:
+        calls.append(name)
+        await asyncio.sleep(0.05)
+        return name
+
+    async def run() -> str:
+        leader = asyncio.create_task(
+            single_flight.do_async("key", lambda: compute("leader"))
+        )
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(
+            single_flight.do_async("key", lambda: compute("follower"))
+        )
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(run()) == "follower"
+    assert calls == ["leader", "follower"]
@@ -0,0 +1,119 @@
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+from pytest_mock import MockerFixture
+
+from wind_app.services.spatial_index import WindFarmSpatialIndex
+from wind_app.services.wind_farm_dashboard import WindFarmDashboard
+
+
+@pytest.fixture
+def wind_farm_data() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "ID": ["ANH", "AVD", "HOR"],
+            "Name": ["Anholt", "Avedøre", "Hornsea"],
+            "Overall capacity": [400.0, 400.0, 1218.0],
+            "Number of turbines": [111, 2, 174],
+            "Country": ["Denmark", "Denmark", "United Kingdom"],
+            "Latitude": [56.6, 56.6, 53.885],
+            "Longitude": [11.21, 11.40, 1.791],
+        }
+    )
+
+
+@pytest.fixture
+def spatial_index(wind_farm_data: pd.DataFrame) -> WindFarmSpatialIndex:
+    return WindFarmSpatialIndex.from_dataframe(wind_farm_data)
+
+
+def test_nearest(spatial_index: WindFarmSpatialIndex) -> None:
+    distances_km, indices = spatial_index.nearest(56.6, 11.21, k=2)
+
+    assert indices.tolist() == [0, 1]
+    assert distances_km[0] == pytest.approx(0, abs=1e-6)
+    # 0.19 degrees of longitude at 56.6 N is about 11.6 km
+    assert distances_km[1] == pytest.approx(11.65, rel=1e-2)
+
+
+def test_within_radius(spatial_index: WindFarmSpatialIndex) -> None:
+    assert spatial_index.within_radius(56.6, 11.3, radius_km=20).tolist() == [0, 1]
+    assert spatial_index.within_radius(53.9, 1.8, radius_km=20).tolist() == [2]
+    assert spatial_index.within_radius(0, 0, radius_km=20).tolist() == []
+
+
+def test_fill_missing_wind_speeds(spatial_index: WindFarmSpatialIndex) -> None:
+    filled = spatial_index.fill_missing_wind_speeds(np.array([np.nan, 8.0, np.nan]))
+
+    assert filled[0] == pytest.approx(8.0)  # Borrowed from Avedøre
+    assert np.isnan(filled[2])  # No neighbours close to Hornsea
+
+
+def test_wake_loss_factors(spatial_index: WindFarmSpatialIndex) -> None:
+    losses = spatial_index.wake_loss_factors(np.array([400.0, 400.0, 1218.0]))
+
+    assert losses[0] == pytest.approx(losses[1])
+    assert 0 < losses[0] < 0.1
+    assert losses[2] == 0
+
+
+@pytest.mark.benchmark
+def test_queries_scale_to_many_locations() -> None:
+    rng = np.random.default_rng(seed=42)
+    spatial_index = WindFarmSpatialIndex(
+        latitudes=rng.uniform(-60, 70, 100_000),
+        longitudes=rng.uniform(-180, 180, 100_000),
+    )
+
+    start = time.perf_counter()
+    for _ in range(100):
+        spatial_index.nearest(56.6, 11.21, k=5)
+        spatial_index.within_radius(56.6, 11.21, radius_km=50)
+    average_query_time = (time.perf_counter() - start) / 200
+
+    assert average_query_time < 1e-3
+
+
+def test_queries_match_brute_force() -> None:
+    rng = np.random.default_rng(seed=42)
+    latitudes = rng.uniform(50, 60, 2_000)
+    longitudes = rng.uniform(0, 15, 2_000)
+    spatial_index = WindFarmSpatialIndex(latitudes=latitudes, longitudes=longitudes)
+
+    # Haversine distances from Anholt to all locations
+    lat, lon = np.radians(latitudes), np.radians(longitudes)
+    lat0, lon0 = np.radians(56.6), np.radians(11.21)
+    haversine = (
+        np.sin((lat - lat0) / 2) ** 2
+        + np.cos(lat0) * np.cos(lat) * np.sin((lon - lon0) / 2) ** 2
+    )
+    distances_km = 2 * 6371.0088 * np.arcsin(np.sqrt(haversine))
+
+    nearest_km, nearest = spatial_index.nearest(56.6, 11.21, k=5)
+    assert nearest.tolist() == np.argsort(distances_km)[:5].tolist()
+    assert nearest_km == pytest.approx(np.sort(distances_km)[:5], rel=1e-6)
+
+    within = spatial_index.within_radius(56.6, 11.21, radius_km=50)
+    assert within.tolist() == np.flatnonzero(distances_km <= 50).tolist()
+
+
+def test_dashboard_spatial_adjustments(
+    mocker: MockerFixture, wind_farm_data: pd.DataFrame
+) -> None:
+    wind_farm_service = mocker.Mock()
+    wind_farm_service.load_wind_farm_data.return_value = wind_farm_data
+    weather_service = mocker.Mock()
+    weather_service.get_current_wind_speed.side_effect = [None, 12.0, 12.0]
+    dashboard = WindFarmDashboard(
+        wind_farm_service=wind_farm_service,
+        weather_service=weather_service,
+        spatial_adjustments=True,
+    )
+
+    farms = dashboard.get_dashboard_data()["wind_farms"]
+
+    assert farms[0]["current_wind_speed"] == 12.0  # Borrowed from Avedøre
+    assert farms[0]["estimated_power"] < 400.0  # Shaded by Avedøre
+    assert farms[2]["estimated_power"] == 1218.0  # No neighbours
@@ -0,0 +1,145 @@
+import asyncio
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from wind_app.services.weather_cache import WeatherCache
+from wind_app.services.weather_service import WeatherService
+
+
+@pytest.fixture
+def cache_path(tmp_path: Path) -> str:
+    return str(tmp_path / "weather_cache.sqlite3")
+
+
+@pytest.fixture
+def weather_cache(cache_path: str) -> Iterator[WeatherCache]:
+    with WeatherCache(cache_path, ttl_seconds=600, max_entries=2) as weather_cache:
+        yield weather_cache
+
+
+def test_get_and_set(weather_cache: WeatherCache) -> None:
+    assert weather_cache.get(56.6, 11.21) is None
+
+    weather_cache.set(56.6, 11.21, 10.5)
+
+    assert weather_cache.get(56.6, 11.21) == 10.5
+    assert weather_cache.get(56.6, 12.46) is None
+
+
+def test_get_and_set_many(cache_path: str) -> None:
+    with WeatherCache(cache_path) as weather_cache:
+        weather_cache.set_many({(56.6, 11.21): 10.5, (53.885, 1.791): 7.0})
+
+        assert weather_cache.get_many(
+            [(56.6, 11.21), (56.6, 12.46), (53.885, 1.791)]
+        ) == {
+            (56.6, 11.21): 10.5,
+            (53.885, 1.791): 7.0,
+        }
+        assert weather_cache.get_many([]) == {}
+
+
+def test_closed_cache_is_missing(cache_path: str) -> None:
+    weather_cache = WeatherCache(cache_path)
+    weather_cache.set(56.6, 11.21, 10.5)
+    weather_cache.close()
+
+    assert weather_cache.get(56.6, 11.21) is None
+
+
+def test_cache_is_shared_through_the_file(
+    weather_cache: WeatherCache, cache_path: str
+) -> None:
+    weather_cache.set(56.6, 11.21, 10.5)
+
+    # Another process (or a restarted one) opens the same file
+    assert WeatherCache(cache_path).get(56.6, 11.21) == 10.5
+
+
+def test_expired_entries_are_missing(cache_path: str) -> None:
+    weather_cache = WeatherCache(cache_path, ttl_seconds=-1)
+    weather_cache.set(56.6, 11.21, 10.5)
+
+    assert weather_cache.get(56.6, 11.21) is None
+
+
+def test_oldest_entries_are_evicted(weather_cache: WeatherCache) -> None:
+    weather_cache.set(1, 1, 1.0)
+    weather_cache.set(2, 2, 2.0)
+    weather_cache.set(3, 3, 3.0)
+
+    assert weather_cache.get(1, 1) is None
+    assert weather_cache.get(2, 2) == 2.0
+    assert weather_cache.get(3, 3) == 3.0
+
+
+def test_leases(weather_cache: WeatherCache, cache_path: str) -> None:
+    other_process_cache = WeatherCache(cache_path)
+
+    assert weather_cache.acquire_lease(56.6, 11.21)
+    assert not other_process_cache.acquire_lease(56.6, 11.21)
+
+    weather_cache.set(56.6, 11.21, 10.5)
+    assert other_process_cache.wait_for(56.6, 11.21) == 10.5
+
+    weather_cache.release_lease(56.6, 11.21)
+    assert other_process_cache.acquire_lease(56.6, 11.21)
+
+
+def test_wait_for_released_lease_without_data(weather_cache: WeatherCache) -> None:
+    assert weather_cache.wait_for(56.6, 11.21) is None
+
+
+def test_weather_service_uses_cache(weather_cache: WeatherCache) -> None:
+    mock_http_client = MagicMock()
+    mock_http_client.get.return_value.json.return_value = {"wind": {"speed": 10.5}}
+    weather_service = WeatherService(http_client=mock_http_client, cache=weather_cache)
+
+    assert weather_service.get_current_wind_speed(56.6, 11.21) == 10.5
+    assert weather_service.get_current_wind_speed(56.6, 11.21) == 10.5
+
+    assert mock_http_client.get.call_count == 1
+    assert weather_cache.get(56.6, 11.21) == 10.5
+
+
+def test_weather_service_does_not_cache_failures(
+    weather_cache: WeatherCache,
+) -> None:
+    mock_http_client = MagicMock()
+    mock_http_client.get.return_value.json.return_value = {}
+    weather_service = WeatherService(http_client=mock_http_client, cache=weather_cache)
+
+    assert weather_service.get_current_wind_speed(56.6, 11.21) is None
+    assert weather_cache.get(56.6, 11.21) is None
+
+
+def test_weather_service_looks_up_cache_in_batches(weather_cache: WeatherCache) -> None:
+    requested_latitudes = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested_latitudes.append(float(request.url.params["lat"]))
+        return httpx.Response(200, json={"wind": {"speed": 8.0}})
+
+    async def get_wind_speeds() -> list[float | None]:
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        ) as async_http_client:
+            weather_service = WeatherService(
+                http_client=MagicMock(),
+                async_http_client=async_http_client,
+                cache=weather_cache,
+            )
+            return await weather_service.get_current_wind_speeds_async(
+                [(56.6, 11.21), (53.885, 1.791), (56.6, 11.21)]
+            )
+
+    weather_cache.set(56.6, 11.21, 10.5)
+
+    assert asyncio.run(get_wind_speeds()) == [10.5, 8.0, 10.5]
+    assert requested_latitudes == [53.885]  # Only the location missing in the cache
+    assert weather_cache.get(53.885, 1.791) == 8.0
+    assert weather_cache.acquire_lease(53.885, 1.791)  # Released after fetching
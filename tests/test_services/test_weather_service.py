@@ -1,7 +1,13 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock
 
+import httpx
 import pytest
+from pytest_mock import MockerFixture
 
+from wind_app.services.circuit_breaker import CircuitBreaker
 from wind_app.services.weather_service import WeatherService
 
 
@@ -56,3 +62,72 @@ def test_get_real_current_wind_speed() -> None:
 
     # Check reasonable value ranges
     assert 0 <= wind_speed <= 50  # m/s
+
+
+def test_get_current_wind_speed_async() -> None:
+    """Test asynchronous weather data retrieval with a mocked transport"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.params["lat"] == "56.6"
+        return httpx.Response(200, json={"wind": {"speed": 10.5}})
+
+    async def get_wind_speed() -> float | None:
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        ) as async_http_client:
+            weather_service = WeatherService(
+                http_client=MagicMock(), async_http_client=async_http_client
+            )
+            return await weather_service.get_current_wind_speed_async(56.6, 11.21)
+
+    assert asyncio.run(get_wind_speed()) == 10.5  # m/s
+
+
+def test_get_current_wind_speed_async_failure() -> None:
+    """Test that failed asynchronous requests return None"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(500)
+
+    async def get_wind_speed() -> float | None:
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        ) as async_http_client:
+            weather_service = WeatherService(
+                http_client=MagicMock(), async_http_client=async_http_client
+            )
+            return await weather_service.get_current_wind_speed_async(56.6, 11.21)
+
+    assert asyncio.run(get_wind_speed()) is None
+
+
+def test_concurrent_lookups_share_one_request(mocker: MockerFixture) -> None:
+    """Lookups of the same coordinates from threads with their own event loops"""
+    requests = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        await asyncio.sleep(0.2)  # Slow weather API
+        return httpx.Response(200, json={"wind": {"speed": 10.5}})
+
+    async_client = httpx.AsyncClient
+    mocker.patch.object(
+        httpx,
+        "AsyncClient",
+        lambda: async_client(transport=httpx.MockTransport(handler)),
+    )
+    weather_service = WeatherService(
+        http_client=MagicMock(), circuit_breaker=CircuitBreaker()
+    )
+    viewers = 8
+    barrier = threading.Barrier(viewers)
+
+    def get_wind_speed() -> float | None:
+        barrier.wait()
+        return asyncio.run(weather_service.get_current_wind_speed_async(56.6, 11.21))
+
+    with ThreadPoolExecutor(max_workers=viewers) as executor:
+        wind_speeds = list(executor.map(lambda _: get_wind_speed(), range(viewers)))
+
+    assert wind_speeds == [10.5] * viewers
+    assert len(requests) == 1
@@ -1,7 +1,14 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
 import pytest
 from pytest_mock import MockerFixture
 
+from wind_app import profiling
 from wind_app.services.weather_service import WeatherService
 from wind_app.services.wind_farm_dashboard import _NO_DATA_SYMBOL, WindFarmDashboard
 from wind_app.services.wind_farm_service.excel import WindFarmServiceExcel
@@ -65,6 +72,44 @@ def test_calculate_turbine_power() -> None:
         assert result == pytest.approx(expected, rel=1e-2)
 
 
+def test_calculate_turbine_power_with_missing_wind_speed() -> None:
+    wind_farm_service = WindFarmServiceExcel(data_file_path="dummy/path.xlsx")
+    dashboard = WindFarmDashboard(wind_farm_service=wind_farm_service)
+
+    assert np.isnan(dashboard.calculate_turbine_power(np.nan, 100))
+
+
+def test_get_dashboard_data_with_some_empty_winds(
+    mocker: MockerFixture, mock_wind_farm_service: WindFarmServiceExcel
+) -> None:
+    # When
+    weather_service = mocker.Mock()
+    weather_service.get_current_wind_speed.side_effect = [10.0, None]
+    dashboard = WindFarmDashboard(
+        wind_farm_service=mock_wind_farm_service, weather_service=weather_service
+    )
+    anholt, avedore = dashboard.get_dashboard_data()["wind_farms"]
+    # Then
+    assert anholt["estimated_power"] == 360.0
+    assert avedore["current_wind_speed"] == _NO_DATA_SYMBOL
+    assert avedore["estimated_power"] == _NO_DATA_SYMBOL
+    assert avedore["efficiency"] == _NO_DATA_SYMBOL
+
+
+def test_calculate_turbine_power_vectorized() -> None:
+    wind_farm_service = WindFarmServiceExcel(data_file_path="dummy/path.xlsx")
+    dashboard = WindFarmDashboard(wind_farm_service=wind_farm_service)
+    wind_speeds = np.array([0, 2, 3, 3.5, 4, 5, 8, 11, 12, 20, 25, 26])
+
+    result = dashboard.calculate_turbine_power_vectorized(
+        wind_speeds, np.full(len(wind_speeds), 100.0)
+    )
+
+    expected = [dashboard.calculate_turbine_power(speed, 100) for speed in wind_speeds]
+    assert result == pytest.approx(expected)
+    assert np.isnan(dashboard.calculate_turbine_power_vectorized([np.nan], [100]))[0]
+
+
 def test_performance_ratings(dashboard: WindFarmDashboard) -> None:
     # Test farm performance ratings
     assert dashboard.get_performance_rating(85) == "Excellent"
@@ -122,6 +167,16 @@ def test_get_dashboard_data(dashboard: WindFarmDashboard) -> None:
     assert data["status_metrics"]["active_farms"] == 2
 
 
+def test_wind_farm_data_is_loaded_once(
+    dashboard: WindFarmDashboard, mock_wind_farm_service: WindFarmServiceExcel
+) -> None:
+    first = dashboard.get_dashboard_data()
+    second = dashboard.get_dashboard_data()
+
+    assert first["wind_farms"] == second["wind_farms"]
+    assert mock_wind_farm_service.load_wind_farm_data.call_count == 1
+
+
 def test_get_dashboard_data_with_empty_winds(
     mocker: MockerFixture, mock_wind_farm_service: WindFarmServiceExcel
 ) -> None:
@@ -146,3 +201,114 @@ def test_get_dashboard_data_with_empty_winds(
             wind_farm_data[column] == _NO_DATA_SYMBOL
             for wind_farm_data in wind_farm_data
         )
+
+
+def test_get_dashboard_data_async(
+    mocker: MockerFixture, mock_wind_farm_service: WindFarmServiceExcel
+) -> None:
+    # When
+    weather_service = mocker.Mock()
+    weather_service.get_current_wind_speeds_async = mocker.AsyncMock(
+        return_value=[10.0, None]
+    )
+    dashboard = WindFarmDashboard(
+        wind_farm_service=mock_wind_farm_service, weather_service=weather_service
+    )
+    data = asyncio.run(dashboard.get_dashboard_data_async())
+    # Then
+    anholt, avedore = data["wind_farms"]
+    assert anholt["current_wind_speed"] == 10.0
+    assert anholt["estimated_power"] == 360.0
+    assert avedore["current_wind_speed"] == _NO_DATA_SYMBOL
+    assert avedore["estimated_power"] == _NO_DATA_SYMBOL
+    # All farms are looked up in one batch
+    weather_service.get_current_wind_speeds_async.assert_awaited_once_with(
+        [(56.6, 11.21), (56.6, 12.45833)], max_concurrent_requests=10
+    )
+
+
+def test_concurrent_async_dashboards_share_one_weather_batch(
+    mocker: MockerFixture, mock_wind_farm_service: WindFarmServiceExcel
+) -> None:
+    async def get_wind_speeds(coordinates, **_) -> list[float]:
+        await asyncio.sleep(0.2)  # Slow weather API
+        return [10.0] * len(coordinates)
+
+    weather_service = mocker.Mock()
+    weather_service.get_current_wind_speeds_async = mocker.AsyncMock(
+        side_effect=get_wind_speeds
+    )
+    viewers = 8
+    barrier = threading.Barrier(viewers)
+
+    def view_dashboard() -> dict:
+        # Each request thread runs its own event loop, as Flask does
+        dashboard = WindFarmDashboard(
+            wind_farm_service=mock_wind_farm_service, weather_service=weather_service
+        )
+        barrier.wait()
+        return asyncio.run(dashboard.get_dashboard_data_async())
+
+    with ThreadPoolExecutor(max_workers=viewers) as executor:
+        results = list(executor.map(lambda _: view_dashboard(), range(viewers)))
+
+    assert weather_service.get_current_wind_speeds_async.await_count == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_concurrent_dashboards_share_one_weather_lookup_per_farm(
+    mocker: MockerFixture, mock_wind_farm_service: WindFarmServiceExcel
+) -> None:
+    def get_wind_speed(latitude: float, longitude: float) -> float:
+        time.sleep(0.1)  # Slow weather API
+        return 10.0
+
+    weather_service = mocker.Mock()
+    weather_service.get_current_wind_speed.side_effect = get_wind_speed
+    viewers = 8
+    barrier = threading.Barrier(viewers)
+
+    def view_dashboard() -> dict:
+        dashboard = WindFarmDashboard(
+            wind_farm_service=mock_wind_farm_service, weather_service=weather_service
+        )
+        barrier.wait()
+        return dashboard.get_dashboard_data()
+
+    with ThreadPoolExecutor(max_workers=viewers) as executor:
+        results = list(executor.map(lambda _: view_dashboard(), range(viewers)))
+
+    assert weather_service.get_current_wind_speed.call_count == 2  # One per farm
+    assert all(result is results[0] for result in results)
+
+
+def test_profiled_dashboard_does_not_join_computation_in_flight(
+    mocker: MockerFixture, mock_wind_farm_service: WindFarmServiceExcel
+) -> None:
+    mocker.patch.object(profiling, "profile_store", profiling.ProfileStore(1))
+    leader_fetching = threading.Event()
+    release_leader = threading.Event()
+
+    def get_wind_speed(latitude: float, longitude: float) -> float:
+        if profiling.is_profiling():
+            return 10.0
+        leader_fetching.set()
+        release_leader.wait(timeout=5)  # Slow weather API for the leader
+        return 10.0
+
+    weather_service = mocker.Mock()
+    weather_service.get_current_wind_speed.side_effect = get_wind_speed
+    dashboard = WindFarmDashboard(
+        wind_farm_service=mock_wind_farm_service, weather_service=weather_service
+    )
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        leader = executor.submit(dashboard.get_dashboard_data)
+        assert leader_fetching.wait(timeout=5)
+
+        with profiling.profile_request("/home", enabled=True) as profile:
+            dashboard.get_dashboard_data()
+        release_leader.set()
+        leader.result()
+
+    assert [stage["name"] for stage in profile.stages] == ["weather", "power", "format"]
@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from wind_app.services.wind_farm_registry import WindFarmRegistry, WindFarmView
+
+
+@pytest.fixture
+def wind_farm_data() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "ID": ["ANH", "AVD", "HOR"],
+            "Name": ["Anholt", "Avedøre", "Hornsea"],
+            "Overall capacity": [400.0, 7.2, 1218.0],
+            "Number of turbines": [111, 2, 174],
+            "Country": ["Denmark", "Denmark", "United Kingdom"],
+            "Latitude": [56.6, 56.6, 53.885],
+            "Longitude": [11.21, 12.458333, 1.791],
+        }
+    )
+
+
+@pytest.fixture
+def registry(wind_farm_data: pd.DataFrame) -> WindFarmRegistry:
+    return WindFarmRegistry.from_dataframe(wind_farm_data)
+
+
+def test_registry_views(registry: WindFarmRegistry) -> None:
+    assert len(registry) == 3
+    assert registry.countries == ("Denmark", "United Kingdom")
+
+    anholt = registry[0]
+    assert isinstance(anholt, WindFarmView)
+    assert anholt.id == "ANH"
+    assert anholt.name == "Anholt"
+    assert anholt.country == "Denmark"
+    assert anholt.overall_capacity == 400.0
+    assert anholt.number_of_turbines == 111
+    assert anholt.latitude == pytest.approx(56.6, rel=1e-6)
+    assert anholt.longitude == pytest.approx(11.21, rel=1e-6)
+
+    assert registry[-1].name == "Hornsea"
+    assert [farm.id for farm in registry] == ["ANH", "AVD", "HOR"]
+
+    with pytest.raises(IndexError):
+        registry[3]
+
+    # Views are slotted and do not carry a per-instance dict
+    assert not hasattr(anholt, "__dict__")
+
+
+def test_registry_uses_compact_types(registry: WindFarmRegistry) -> None:
+    df = registry.to_dataframe()
+
+    assert df["Overall capacity"].dtype == np.float32
+    assert df["Number of turbines"].dtype == np.int32
+    assert isinstance(df["Country"].dtype, pd.CategoricalDtype)
+    assert df["Name"].tolist() == ["Anholt", "Avedøre", "Hornsea"]
+
+    # Columns are shared between requests, so they cannot be modified
+    assert not registry.overall_capacities.flags.writeable
+
+
+def test_registry_memory_footprint() -> None:
+    rng = np.random.default_rng(seed=42)
+    farm_count = 3000
+    large_data = pd.DataFrame(
+        {
+            "ID": [f"WF{index:05d}" for index in range(farm_count)],
+            "Name": [f"Wind Farm {index}" for index in range(farm_count)],
+            "Overall capacity": rng.uniform(5, 1500, farm_count),
+            "Number of turbines": rng.integers(1, 200, farm_count),
+            "Country": rng.choice(["Denmark", "Germany", "United Kingdom"], farm_count),
+            "Latitude": rng.uniform(50, 60, farm_count),
+            "Longitude": rng.uniform(0, 15, farm_count),
+        }
+    )
+    registry = WindFarmRegistry.from_dataframe(large_data)
+
+    footprint = registry.memory_footprint()
+
+    assert footprint > 0
+    assert footprint < large_data.memory_usage(deep=True).sum()
@@ -9,3 +9,17 @@ def create_app():
     app.register_blueprint(home, url_prefix="/")
 
     return app
+
+
+def create_asgi_app():
+    """Create the app served natively by an ASGI server, used in production"""
+    # Imported here as Quart is only needed by the ASGI server
+    from quart import Quart
+
+    from .routes.home_asgi import home_asgi
+
+    app = Quart(__name__)
+
+    app.register_blueprint(home_asgi, url_prefix="/")
+
+    return app
@@ -0,0 +1,246 @@
+"""
+Profiling Module
+
+Opt-in, sampled profiling of dashboard requests. A request is profiled when it
+carries the admin token in the `X-Profile-Token` header or when it is picked
+by the sampling rate. Each stage of the pipeline (loading data, fetching
+weather, calculating power, formatting, rendering) is measured and captured
+with cProfile. The last profiles are kept in a bounded ring buffer and served
+by the `/_profiles` endpoint.
+
+When a request is not profiled, `profile_stage` returns a shared no-op
+context manager, so instrumented code pays only for a context variable lookup.
+Work shared between concurrent requests should be done by a profiled request
+itself (see `is_profiling`), otherwise its stages are missing from the profile.
+
+Configuration (environment variables):
+- WIND_APP_PROFILE_TOKEN: admin token enabling profiling and the endpoint
+- WIND_APP_PROFILE_SAMPLE_RATE: fraction of requests profiled, 0 by default
+- WIND_APP_PROFILE_HISTORY: number of profiles kept, 20 by default
+
+Example:
+    with profile_request("/home", enabled=True):
+        with profile_stage("load"):
+            load_data()
+"""
+
+import cProfile
+import hmac
+import io
+import os
+import pstats
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator, Mapping
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any
+
+from wind_app.utils import log
+
+PROFILE_TOKEN_HEADER = "X-Profile-Token"
+
+_STATS_LINES = 25  # Number of functions listed for each stage
+
+_NOT_PROFILED = nullcontext()
+
+
+class ProfilingSettings:
+    """Runtime switches of the profiling, can be changed while the app runs"""
+
+    def __init__(self) -> None:
+        self.token = os.getenv("WIND_APP_PROFILE_TOKEN") or None
+        self.sample_rate = _parse_sample_rate(
+            os.getenv("WIND_APP_PROFILE_SAMPLE_RATE", "0")
+        )
+
+
+class RequestProfile:
+    """Durations and cProfile statistics of the stages of a single request"""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.started_at = datetime.now()
+        self.duration_seconds: float | None = None
+        self.stages: list[dict[str, Any]] = []
+
+    def add_stage(self, name: str, duration_seconds: float, stats: str | None) -> None:
+        """Record a finished stage"""
+        self.stages.append(
+            {"name": name, "duration_seconds": duration_seconds, "stats": stats}
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "path": self.path,
+            "started_at": self.started_at.isoformat(),
+            "duration_seconds": self.duration_seconds,
+            "stages": self.stages,
+        }
+
+
+class ProfileStore:
+    """Thread-safe ring buffer with the most recent profiles"""
+
+    def __init__(self, max_profiles: int) -> None:
+        self._lock = threading.Lock()
+        self._profiles: deque[RequestProfile] = deque(maxlen=max_profiles)
+
+    def add(self, profile: RequestProfile) -> None:
+        with self._lock:
+            self._profiles.append(profile)
+
+    def get_all(self) -> list[RequestProfile]:
+        """Stored profiles, the most recent first"""
+        with self._lock:
+            return list(reversed(self._profiles))
+
+
+class _ProfiledStage:
+    """Measures a stage and captures it with cProfile when no other stage is captured"""
+
+    __slots__ = ("_profile", "_name", "_profiler", "_started")
+
+    def __init__(self, profile: RequestProfile, name: str) -> None:
+        self._profile = profile
+        self._name = name
+        self._profiler: cProfile.Profile | None = None
+        self._started = 0.0
+
+    def __enter__(self) -> None:
+        # Only one cProfile profiler can be active in the interpreter at a time,
+        # stages of concurrent requests are then only timed
+        if _profiler_lock.acquire(blocking=False):
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+                self._profiler = profiler
+            except ValueError:  # Another profiling tool is active
+                _profiler_lock.release()
+        self._started = time.perf_counter()
+
+    def __exit__(self, *exc_info: object) -> None:
+        duration = time.perf_counter() - self._started
+        stats = None
+
+        if self._profiler is not None:
+            self._profiler.disable()
+            _profiler_lock.release()
+
+            stream = io.StringIO()
+            pstats.Stats(self._profiler, stream=stream).sort_stats(
+                "cumulative"
+            ).print_stats(_STATS_LINES)
+            stats = stream.getvalue()
+
+        self._profile.add_stage(self._name, duration, stats)
+
+
+def is_profiling_requested(headers: Mapping[str, str]) -> bool:
+    """Check whether a request should be profiled, by admin header or by sampling"""
+    if is_admin(headers):
+        return True
+    return settings.sample_rate > 0 and random.random() < settings.sample_rate
+
+
+def is_admin(headers: Mapping[str, str]) -> bool:
+    """Check whether a request carries the admin token"""
+    token = settings.token
+    provided_token = headers.get(PROFILE_TOKEN_HEADER)
+    if token is None or provided_token is None:
+        return False
+    # Constant-time comparison does not leak how much of the token matched
+    return hmac.compare_digest(provided_token.encode(), token.encode())
+
+
+@contextmanager
+def profile_request(path: str, enabled: bool) -> Iterator[RequestProfile | None]:
+    """
+    Profile stages run within the block and store the profile afterwards
+
+    Args:
+        path: Path of the profiled request
+        enabled: Whether the request is profiled at all
+
+    Yields:
+        Profile being recorded, or None if profiling is disabled
+    """
+    if not enabled:
+        yield None
+        return
+
+    profile = RequestProfile(path)
+    context_token = _current_profile.set(profile)
+    started = time.perf_counter()
+    try:
+        yield profile
+    finally:
+        profile.duration_seconds = time.perf_counter() - started
+        _current_profile.reset(context_token)
+        profile_store.add(profile)
+
+
+def is_profiling() -> bool:
+    """Check whether the current request is being profiled"""
+    return _current_profile.get() is not None
+
+
+def profile_stage(name: str) -> AbstractContextManager[None]:
+    """
+    Measure a stage of the current request if it is being profiled
+
+    Args:
+        name: Name of the stage shown in the profile
+
+    Returns:
+        Context manager wrapping the stage
+    """
+    profile = _current_profile.get()
+    if profile is None:
+        return _NOT_PROFILED
+    return _ProfiledStage(profile, name)
+
+
+def _parse_sample_rate(value: str) -> float:
+    """Parse the sampling rate, disabling sampling if the value is not valid"""
+    try:
+        sample_rate = float(value)
+    except ValueError:
+        log(f"❌ Invalid profiling sample rate {value!r}, sampling is disabled")
+        return 0.0
+
+    if not 0 <= sample_rate <= 1:
+        log(
+            f"❌ Profiling sample rate {value!r} is not between 0 and 1, sampling is disabled"
+        )
+        return 0.0
+
+    return sample_rate
+
+
+def _parse_history(value: str) -> int:
+    """Parse the number of kept profiles, falling back to the default if not valid"""
+    try:
+        history = int(value)
+    except ValueError:
+        history = 0
+
+    if history <= 0:
+        log(f"❌ Invalid profiling history {value!r}, keeping 20 profiles")
+        return 20
+
+    return history
+
+
+_current_profile: ContextVar[RequestProfile | None] = ContextVar(
+    "current_profile", default=None
+)
+_profiler_lock = threading.Lock()
+
+settings = ProfilingSettings()
+profile_store = ProfileStore(
+    max_profiles=_parse_history(os.getenv("WIND_APP_PROFILE_HISTORY", "20"))
+)
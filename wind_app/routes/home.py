@@ -1,54 +1,205 @@
-from flask import Blueprint, render_template
+import atexit
+import time
+from typing import TYPE_CHECKING, Any
 
-from wind_app.services.wind_farm_dashboard import WindFarmDashboard
-from wind_app.services.wind_farm_service.excel import WindFarmServiceExcel
+from flask import Blueprint, abort, render_template, request
+
+from wind_app import profiling
+from wind_app.services.circuit_breaker import OPEN, weather_api_breaker
+from wind_app.services.status import dashboard_status
 from wind_app.utils import log
 
+# NOTE: Services pull in pandas, numpy, scipy and httpx. They are imported inside
+#       the views, so creating the app (e.g. in a freshly forked worker) stays fast.
+if TYPE_CHECKING:
+    from wind_app.services.weather_cache import WeatherCache
+    from wind_app.services.weather_service import WeatherService
+
 # Create blueprint for home page routes
 home = Blueprint("home", __name__)
 
+# Snapshots older than this do not make the app ready while the weather API is down,
+# used before the weather cache with its own TTL is created
+MAX_SNAPSHOT_AGE_SECONDS = 600
+
+# Created on the first dashboard request
+_weather_cache: "WeatherCache | None" = None
+_weather_service: "WeatherService | None" = None
+
+
+def get_weather_cache() -> "WeatherCache":
+    """Get the weather cache shared by all requests of the process"""
+    from wind_app.services.weather_cache import WeatherCache
+
+    global _weather_cache
+    if _weather_cache is None:
+        _weather_cache = WeatherCache()
+        atexit.register(_weather_cache.close)
+    return _weather_cache
+
+
+def get_weather_service() -> "WeatherService":
+    """
+    Get the weather service shared by all requests of the process
+
+    Dashboard computations are only coalesced between dashboards using
+    the same weather service, so all requests must use this one.
+    """
+    from wind_app.services.weather_service import WeatherService
+
+    global _weather_service
+    if _weather_service is None:
+        _weather_service = WeatherService(cache=get_weather_cache())
+    return _weather_service
+
+
+@home.route("/healthz")
+def show_liveness() -> dict[str, Any]:
+    """
+    Liveness probe - the process is up and serving requests
+
+    Returns:
+        JSON with a static status
+    """
+    return {"status": "alive"}
+
+
+@home.route("/readyz")
+def show_readiness() -> tuple[dict[str, Any], int]:
+    """
+    Readiness probe answered from in-memory state only, without any I/O
+
+    The app is not ready only when the weather API is failing and no fresh
+    snapshot shows that cached wind speeds still keep dashboards live. All
+    instances share the weather API, so gating on the breaker alone would take
+    the whole fleet out of rotation during an upstream outage.
+
+    Returns:
+        JSON with the status details and 200 if ready, 503 otherwise
+    """
+    snapshot_age = dashboard_status.snapshot_age_seconds
+    breaker_state = weather_api_breaker.state
+    weather_cache = _weather_cache
+
+    # Wind speeds of a snapshot are served from the cache until they expire
+    max_snapshot_age = (
+        weather_cache.ttl_seconds
+        if weather_cache is not None
+        else MAX_SNAPSHOT_AGE_SECONDS
+    )
+    has_fresh_snapshot = snapshot_age is not None and snapshot_age <= max_snapshot_age
+    is_ready = breaker_state != OPEN or has_fresh_snapshot
+
+    status = {
+        "status": "ready" if is_ready else "not_ready",
+        "snapshot_age_seconds": snapshot_age,
+        "last_refresh_duration_seconds": (
+            dashboard_status.last_refresh_duration_seconds
+        ),
+        "weather_api_breaker": breaker_state,
+        "weather_cache": {
+            "entries": weather_cache.entries,
+            "max_entries": weather_cache.max_entries,
+            "fill_level": round(weather_cache.fill_level, 3),
+        }
+        if weather_cache is not None
+        else None,
+    }
+    return status, 200 if is_ready else 503
+
 
 @home.route("/")
 @home.route("/home")
-def show_dashboard() -> str:
+async def show_dashboard() -> str:
     """
     Display the wind farm dashboard with real-time data
 
     Returns:
         Rendered HTML template with wind farm data
     """
+    with profiling.profile_request(
+        request.path, enabled=profiling.is_profiling_requested(request.headers)
+    ):
+        context = await load_dashboard_context()
+
+        # Render template with processed data
+        with profiling.profile_stage("render"):
+            return render_template("home.html.j2", **context)
+
+
+async def load_dashboard_context() -> dict[str, Any]:
+    """
+    Load dashboard data for the dashboard template
+
+    Shared by the Flask and the ASGI (`home_asgi`) dashboard views.
+
+    Returns:
+        Template variables, with an error message if the data could not be loaded
+    """
+    from wind_app.services.wind_farm_dashboard import WindFarmDashboard
+    from wind_app.services.wind_farm_service.excel import WindFarmServiceExcel
+
     try:
         # Initialize the unified wind farm dashboard
         log("🔧 Initializing wind farm dashboard...")
         wind_farm_service = WindFarmServiceExcel(data_file_path="data/windfarms.xlsx")
-        dashboard = WindFarmDashboard(wind_farm_service=wind_farm_service)
+
+        dashboard = WindFarmDashboard(
+            wind_farm_service=wind_farm_service,
+            weather_service=get_weather_service(),
+            spatial_adjustments=True,
+        )
 
         # Get all dashboard data (loading, processing, and formatting)
-        dashboard_data = dashboard.get_dashboard_data()
+        refresh_start = time.perf_counter()
+        dashboard_data = await dashboard.get_dashboard_data_async()
+        # A refresh counts only if live weather data was obtained
+        if dashboard_data["status_metrics"]["farms_reporting"]:
+            dashboard_status.record_refresh(time.perf_counter() - refresh_start)
 
         log("✅ Dashboard ready!")
 
-        # Render template with processed data
-        return render_template(
-            template_name_or_list="home.html.j2",
-            wind_farms=dashboard_data["wind_farms"],
-            country_performance=dashboard_data["country_performance"],
-            fleet_summary=dashboard_data["fleet_summary"],
-            status_metrics=dashboard_data["status_metrics"],
-        )
+        return {
+            "wind_farms": dashboard_data["wind_farms"],
+            "country_performance": dashboard_data["country_performance"],
+            "fleet_summary": dashboard_data["fleet_summary"],
+            "status_metrics": dashboard_data["status_metrics"],
+        }
 
     except Exception as error:
         log(f"❌ Error loading dashboard: {error}")
 
         # Get empty dashboard data structure for error case
-        dashboard = WindFarmDashboard("data/windfarms.xlsx")
-        empty_data = dashboard.get_empty_dashboard_data()
-
-        return render_template(
-            "home.html.j2",
-            wind_farms=empty_data["wind_farms"],
-            country_performance=empty_data["country_performance"],
-            fleet_summary=empty_data["fleet_summary"],
-            status_metrics=empty_data["status_metrics"],
-            error_message="Unable to load wind farm data. Please check your configuration and try again.",
-        )
+        empty_data = WindFarmDashboard.get_empty_dashboard_data()
+
+        return {
+            "wind_farms": empty_data["wind_farms"],
+            "country_performance": empty_data["country_performance"],
+            "fleet_summary": empty_data["fleet_summary"],
+            "status_metrics": empty_data["status_metrics"],
+            "error_message": "Unable to load wind farm data. Please check your configuration and try again.",
+        }
+
+
+@home.route("/_profiles")
+def show_profiles() -> dict[str, Any]:
+    """
+    List the most recent request profiles, available only to admins
+
+    Returns:
+        JSON with profiles of the last profiled requests, the most recent first
+    """
+    if not profiling.is_admin(request.headers):
+        abort(404)
+
+    return get_profiles()
+
+
+def get_profiles() -> dict[str, Any]:
+    """Most recent request profiles with the profiling settings"""
+    return {
+        "sample_rate": profiling.settings.sample_rate,
+        "profiles": [
+            profile.to_dict() for profile in profiling.profile_store.get_all()
+        ],
+    }
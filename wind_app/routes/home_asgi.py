@@ -0,0 +1,58 @@
+"""
+ASGI port of the home routes, served by Quart
+
+Quart runs the views as coroutines on the event loop of the ASGI server, so a
+dashboard render waiting for the weather API holds no thread and many
+simultaneous viewers are served by a single worker. The views share their
+logic with the Flask blueprint in `home`, only the framework glue differs.
+"""
+
+from typing import Any
+
+from quart import Blueprint, abort, render_template, request
+
+from wind_app import profiling
+from wind_app.routes import home as views
+
+# Create blueprint for home page routes
+home_asgi = Blueprint("home", __name__)
+
+
+@home_asgi.route("/healthz")
+async def show_liveness() -> dict[str, Any]:
+    """Liveness probe - the process is up and serving requests"""
+    return views.show_liveness()
+
+
+@home_asgi.route("/readyz")
+async def show_readiness() -> tuple[dict[str, Any], int]:
+    """Readiness probe answered from in-memory state only, without any I/O"""
+    return views.show_readiness()
+
+
+@home_asgi.route("/")
+@home_asgi.route("/home")
+async def show_dashboard() -> str:
+    """
+    Display the wind farm dashboard with real-time data
+
+    Returns:
+        Rendered HTML template with wind farm data
+    """
+    with profiling.profile_request(
+        request.path, enabled=profiling.is_profiling_requested(request.headers)
+    ):
+        context = await views.load_dashboard_context()
+
+        # Render template with processed data
+        with profiling.profile_stage("render"):
+            return await render_template("home.html.j2", **context)
+
+
+@home_asgi.route("/_profiles")
+async def show_profiles() -> dict[str, Any]:
+    """List the most recent request profiles, available only to admins"""
+    if not profiling.is_admin(request.headers):
+        abort(404)
+
+    return views.get_profiles()
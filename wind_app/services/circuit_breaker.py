@@ -0,0 +1,82 @@
+"""
+Circuit Breaker Module
+
+Protects the app from hammering an upstream API that is failing. After a
+number of consecutive failures the breaker opens and requests are rejected
+immediately. Once the reset timeout passes, a single trial request is let
+through (half-open) - its success closes the breaker, its failure opens it again.
+
+Example:
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout_seconds=30)
+    if breaker.allow_request():
+        ...  # call the API and report the outcome
+        breaker.record_success()
+"""
+
+import threading
+import time
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker counting consecutive failures"""
+
+    def __init__(
+        self, failure_threshold: int = 5, reset_timeout_seconds: float = 30
+    ) -> None:
+        """
+        Initialize a closed circuit breaker
+
+        Args:
+            failure_threshold: Consecutive failures which open the breaker
+            reset_timeout_seconds: How long the breaker stays open before a trial request
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_progress = False
+
+    @property
+    def state(self) -> str:
+        """Current state: closed, open or half_open"""
+        opened_at = self._opened_at
+        if opened_at is None:
+            return CLOSED
+        if time.monotonic() - opened_at < self.reset_timeout_seconds:
+            return OPEN
+        return HALF_OPEN
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent upstream"""
+        with self._lock:
+            state = self.state
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and not self._trial_in_progress:
+                self._trial_in_progress = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful request"""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_progress = False
+
+    def record_failure(self) -> None:
+        """Count a failed request, opening the breaker over the threshold"""
+        with self._lock:
+            self._failures += 1
+            self._trial_in_progress = False
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+weather_api_breaker = CircuitBreaker()  # Shared by all weather services in the process
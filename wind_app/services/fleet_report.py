@@ -0,0 +1,208 @@
+"""
+Fleet Report Module
+
+Computes country and fleet summaries for recorded wind speed snapshots
+without the web app. Snapshot files are CSV or Parquet tables with columns:
+- ID: Wind farm identifier, as in the wind farm data
+- Timestamp: Time of the measurement
+- Wind speed: Wind speed in m/s
+
+Snapshots are matched to farms by ID, so the IDs in the wind farm data must be
+unique - ambiguous IDs are rejected instead of counting a snapshot for two farms.
+
+Files are streamed in chunks, so memory use depends on the chunk size and the
+number of distinct timestamps rather than on the file size. Each chunk goes
+through the vectorized power curve of `WindFarmDashboard` and is reduced to
+partial sums per timestamp and country, which are merged at the end.
+
+The sums describe the farms reporting at each timestamp, which differs from
+the dashboard:
+- capacity and efficiency count only farms with a known wind speed, while the
+  dashboard counts all farms and takes missing power as 0
+- wind speeds are used as recorded, without gap filling from nearby farms
+  and without wake losses
+
+Example:
+    farms = WindFarmServiceExcel("data/windfarms.xlsx").load_wind_farm_data()
+    partial = summarize_snapshot_file("snapshots/2025-01.csv", farms)
+    country_report, fleet_report = build_reports([partial])
+"""
+
+import os
+from collections.abc import Iterable, Iterator
+
+import numpy as np
+import pandas as pd
+
+from wind_app.services.wind_farm_dashboard import (
+    AVERAGE_HOME_CONSUMPTION_KW,
+    CO2_AVOIDED_PER_MWH,
+    WindFarmDashboard,
+)
+from wind_app.utils import log
+
+SNAPSHOT_COLUMNS = ["ID", "Timestamp", "Wind speed"]
+
+_SUM_COLUMNS = ["total_capacity", "total_generation", "farms_reporting"]
+
+
+def read_snapshot_chunks(
+    path: str, chunk_size: int = 100_000
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream a snapshot file in chunks
+
+    Args:
+        path: CSV or Parquet file with snapshot columns
+        chunk_size: Maximum number of rows per chunk
+
+    Yields:
+        DataFrames with the snapshot columns
+    """
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == ".csv":
+        yield from pd.read_csv(
+            path,
+            usecols=SNAPSHOT_COLUMNS,
+            dtype={"ID": str, "Wind speed": float},
+            parse_dates=["Timestamp"],
+            chunksize=chunk_size,
+        )
+    elif extension in (".parquet", ".pq"):
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(
+            batch_size=chunk_size, columns=SNAPSHOT_COLUMNS
+        ):
+            yield batch.to_pandas()
+    else:
+        raise ValueError(f"Unsupported snapshot file format: {path}")
+
+
+def summarize_snapshot_file(
+    path: str, wind_farm_data: pd.DataFrame, chunk_size: int = 100_000
+) -> pd.DataFrame:
+    """
+    Reduce a snapshot file to partial sums per timestamp and country
+
+    Args:
+        path: CSV or Parquet snapshot file
+        wind_farm_data: Wind farm data with ID, Country and Overall capacity columns
+        chunk_size: Maximum number of rows processed at once
+
+    Returns:
+        DataFrame indexed by Timestamp and Country with summed capacity,
+        generation and number of farms reporting
+    """
+    log(f"📊 Summarizing snapshots from: {path}")
+
+    check_unique_farm_ids(wind_farm_data)
+    farms = wind_farm_data.set_index("ID")[["Country", "Overall capacity"]]
+    partials = []
+
+    for chunk in read_snapshot_chunks(path, chunk_size=chunk_size):
+        # Snapshots of farms missing in the wind farm data are skipped
+        chunk = chunk.join(farms, on="ID", how="inner")
+        chunk["Estimated power"] = WindFarmDashboard.calculate_turbine_power_vectorized(
+            wind_speeds=chunk["Wind speed"].to_numpy(dtype=float),
+            max_capacities=chunk["Overall capacity"].to_numpy(dtype=float),
+        )
+        partials.append(_sum_by_timestamp_and_country(chunk))
+
+        # Merge partial sums as they come to keep memory bounded
+        if len(partials) > 1:
+            partials = [_merge_partials(partials)]
+
+    if not partials:
+        return _empty_partial()
+
+    return partials[0]
+
+
+def check_unique_farm_ids(wind_farm_data: pd.DataFrame) -> None:
+    """
+    Make sure each snapshot can be matched to a single farm
+
+    Raises:
+        ValueError: If some IDs are used by more than one farm
+    """
+    ids = wind_farm_data["ID"]
+    duplicated_ids = sorted(ids[ids.duplicated()].unique())
+    if duplicated_ids:
+        raise ValueError(
+            "Wind farm IDs must be unique to match snapshots,"
+            f" found duplicates: {', '.join(duplicated_ids)}"
+        )
+
+
+def build_reports(
+    partials: Iterable[pd.DataFrame],
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Merge partial sums into country and fleet reports
+
+    Args:
+        partials: Results of `summarize_snapshot_file` for all files
+
+    Returns:
+        Tuple of country report (per timestamp and country)
+        and fleet report (per timestamp)
+    """
+    totals = _merge_partials([*partials, _empty_partial()])
+
+    country_report = _add_efficiency(totals, "capacity_factor").reset_index()
+
+    fleet_report = _add_efficiency(
+        totals.groupby(level="Timestamp").sum(), "fleet_efficiency"
+    )
+    fleet_report["co2_avoided"] = fleet_report["total_generation"] * CO2_AVOIDED_PER_MWH
+    fleet_report["homes_powered"] = (
+        fleet_report["total_generation"] * 1000 / AVERAGE_HOME_CONSUMPTION_KW
+    )
+
+    return country_report, fleet_report.reset_index()
+
+
+def _sum_by_timestamp_and_country(chunk: pd.DataFrame) -> pd.DataFrame:
+    """Sum capacity and generation of farms with known wind speeds"""
+    reporting = chunk[chunk["Wind speed"].notna()]
+    return (
+        reporting.assign(farms_reporting=1)
+        .rename(
+            columns={
+                "Overall capacity": "total_capacity",
+                "Estimated power": "total_generation",
+            }
+        )
+        .groupby(["Timestamp", "Country"])[_SUM_COLUMNS]
+        .sum()
+    )
+
+
+def _merge_partials(partials: list[pd.DataFrame]) -> pd.DataFrame:
+    """Add up partial sums with overlapping timestamps and countries"""
+    return pd.concat(partials).groupby(level=["Timestamp", "Country"]).sum()
+
+
+def _empty_partial() -> pd.DataFrame:
+    """Partial sums without any rows"""
+    index = pd.MultiIndex.from_arrays(
+        [pd.DatetimeIndex([]), pd.Index([], dtype=object)],
+        names=["Timestamp", "Country"],
+    )
+    return pd.DataFrame(
+        {column: pd.Series(dtype=float) for column in _SUM_COLUMNS}, index=index
+    )
+
+
+def _add_efficiency(totals: pd.DataFrame, column: str) -> pd.DataFrame:
+    """Add generation as a percentage of capacity"""
+    report = totals.copy()
+    capacity = report["total_capacity"].to_numpy(dtype=float)
+    generation = report["total_generation"].to_numpy(dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        report[column] = np.where(capacity > 0, generation / capacity * 100, 0.0)
+    report["farms_reporting"] = report["farms_reporting"].astype(int)
+    return report
@@ -0,0 +1,154 @@
+"""
+Single Flight Module
+
+Request coalescing for expensive computations. When several callers ask for
+the same key at the same time, only the first one (the leader) runs the
+computation and all the others wait for it and share its result or error.
+Nothing is cached - once the computation finishes, the next call for the key
+starts a new one. Only regular exceptions are shared: if the leader is cancelled
+or interrupted, it alone sees that and the waiting callers retry.
+
+Works across threads and event loops, so concurrent Flask requests served by
+different worker threads share one in-flight computation.
+
+Example:
+    dashboard_requests = SingleFlight()
+    data = dashboard_requests.do("dashboard", dashboard.get_dashboard_data)
+    data = await dashboard_requests.do_async(
+        "dashboard", dashboard.get_dashboard_data_async
+    )
+"""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    """Computation in flight shared by the leader and its followers"""
+
+    __slots__ = ("done", "result", "error", "abandoned", "loop", "future")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Exception | None = None
+        # Set when the leader was cancelled or interrupted, followers retry then
+        self.abandoned = False
+        # Set when the leader is a coroutine, lets followers from the same
+        # event loop wait without blocking a thread
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.future: asyncio.Future | None = None
+
+    def get(self) -> Any:
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class SingleFlight:
+    """Group of computations where concurrent calls with the same key are coalesced"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, function: Callable[[], T]) -> T:
+        """
+        Run the function unless a computation for the key is already in flight
+
+        Args:
+            key: Identifies computations giving the same result
+            function: Computation to run if this caller becomes the leader
+
+        Returns:
+            Result of the function, shared between all concurrent callers
+        """
+        while True:
+            call, is_leader = self._join(key)
+            if is_leader:
+                break
+
+            call.done.wait()
+            if not call.abandoned:
+                return call.get()
+
+        try:
+            call.result = function()
+        except Exception as error:
+            call.error = error
+        except BaseException:
+            call.abandoned = True
+            raise
+        finally:
+            self._finish(key, call)
+
+        return call.get()
+
+    async def do_async(self, key: Hashable, function: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await the coroutine function unless a computation for the key is already in flight
+
+        Args:
+            key: Identifies computations giving the same result
+            function: Coroutine function to await if this caller becomes the leader
+
+        Returns:
+            Result of the coroutine, shared between all concurrent callers
+        """
+        loop = asyncio.get_running_loop()
+
+        while True:
+            call, is_leader = self._join(key, loop=loop)
+            if is_leader:
+                break
+
+            if call.loop is loop and call.future is not None:
+                await asyncio.shield(call.future)
+            else:
+                await asyncio.to_thread(call.done.wait)
+            if not call.abandoned:
+                return call.get()
+
+        try:
+            call.result = await function()
+        except Exception as error:
+            call.error = error
+        except BaseException:  # Cancelled, only the leader is affected
+            call.abandoned = True
+            raise
+        finally:
+            self._finish(key, call)
+            if call.future is not None:
+                call.future.set_result(None)
+
+        return call.get()
+
+    def in_flight(self) -> int:
+        """Number of computations currently running"""
+        return len(self._calls)
+
+    def _join(
+        self, key: Hashable, loop: asyncio.AbstractEventLoop | None = None
+    ) -> tuple[_Call, bool]:
+        """Return the call in flight for the key and whether the caller leads it"""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                return call, False
+
+            call = _Call()
+            if loop is not None:
+                call.loop = loop
+                call.future = loop.create_future()
+            self._calls[key] = call
+            return call, True
+
+    def _finish(self, key: Hashable, call: _Call) -> None:
+        """Publish the outcome of the call and let new calls for the key start"""
+        with self._lock:
+            self._calls.pop(key, None)
+        call.done.set()
@@ -0,0 +1,202 @@
+"""
+Spatial Index Module
+
+Neighbourhood queries over wind farm coordinates. Farms close to each other
+shade each other (wake losses) and share similar weather, so a farm with a
+missing wind speed can borrow it from its neighbours.
+
+Coordinates are projected onto the unit sphere and indexed with a KD-tree.
+The straight-line (chord) distance between two points on the sphere grows
+monotonically with the great-circle distance, so nearest-neighbour and radius
+queries give the same results as a haversine ball tree, while staying
+sub-millisecond for hundreds of thousands of locations.
+
+Example:
+    spatial_index = WindFarmSpatialIndex.from_dataframe(wind_farm_data)
+    distances_km, indices = spatial_index.nearest(56.6, 11.21, k=3)
+"""
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+EARTH_RADIUS_KM = 6371.0088  # Mean Earth radius
+
+DEFAULT_NEIGHBOURHOOD_RADIUS_KM = 50.0  # Max distance to borrow wind speed from
+DEFAULT_WAKE_RADIUS_KM = 30.0  # Max distance at which farms shade each other
+DEFAULT_WAKE_LOSS_COEFFICIENT = 0.1  # Loss caused by an equally sized adjacent farm
+DEFAULT_MAX_WAKE_LOSS = 0.25  # Upper bound of the total wake loss for a farm
+
+
+class WindFarmSpatialIndex:
+    """KD-tree index over wind farm locations with great-circle distances"""
+
+    def __init__(self, latitudes: np.ndarray, longitudes: np.ndarray) -> None:
+        """
+        Build the index for the given coordinates
+
+        Args:
+            latitudes: Latitudes in degrees (-90.0 to 90.0)
+            longitudes: Longitudes in degrees (-180.0 to 180.0)
+        """
+        self._points = _to_unit_vectors(latitudes, longitudes)
+        self._tree = cKDTree(self._points)
+
+    @classmethod
+    def from_dataframe(cls, wind_farm_data: pd.DataFrame) -> "WindFarmSpatialIndex":
+        """Build the index from `Latitude` and `Longitude` columns"""
+        return cls(
+            latitudes=wind_farm_data["Latitude"].to_numpy(dtype=float),
+            longitudes=wind_farm_data["Longitude"].to_numpy(dtype=float),
+        )
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def nearest(
+        self, latitude: float, longitude: float, k: int = 1
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Find the nearest wind farms to a location
+
+        Args:
+            latitude: Location latitude
+            longitude: Location longitude
+            k: Number of neighbours to return
+
+        Returns:
+            Tuple of distances in km and row indices, both sorted by distance
+        """
+        k = min(k, len(self))
+        point = _to_unit_vectors(np.array([latitude]), np.array([longitude]))[0]
+        chords, indices = self._tree.query(point, k=[*range(1, k + 1)])
+        return _chord_to_km(np.asarray(chords)), np.asarray(indices)
+
+    def within_radius(
+        self, latitude: float, longitude: float, radius_km: float
+    ) -> np.ndarray:
+        """
+        Find all wind farms within a great-circle radius of a location
+
+        Args:
+            latitude: Location latitude
+            longitude: Location longitude
+            radius_km: Search radius in kilometres
+
+        Returns:
+            Sorted row indices of wind farms within the radius
+        """
+        point = _to_unit_vectors(np.array([latitude]), np.array([longitude]))[0]
+        indices = self._tree.query_ball_point(point, r=_km_to_chord(radius_km))
+        return np.sort(np.asarray(indices, dtype=np.intp))
+
+    def fill_missing_wind_speeds(
+        self,
+        wind_speeds: np.ndarray,
+        radius_km: float = DEFAULT_NEIGHBOURHOOD_RADIUS_KM,
+        max_neighbours: int = 8,
+    ) -> np.ndarray:
+        """
+        Fill missing wind speeds with an inverse-distance weighted average of neighbours
+
+        Args:
+            wind_speeds: Wind speeds in m/s aligned with the index, NaN when missing
+            radius_km: Only neighbours within this distance are used
+            max_neighbours: Maximum number of neighbours considered per farm
+
+        Returns:
+            Copy of wind speeds with gaps filled where a neighbour had data
+        """
+        filled = np.array(wind_speeds, dtype=float)
+        missing = np.flatnonzero(np.isnan(filled))
+        if len(missing) == 0 or len(missing) == len(filled):
+            return filled
+
+        # Ask for one extra neighbour as the farm itself is always the closest
+        k = min(max_neighbours + 1, len(self))
+        chords, indices = self._tree.query(
+            self._points[missing],
+            k=[*range(1, k + 1)],
+            distance_upper_bound=_km_to_chord(radius_km),
+        )
+
+        # Neighbours beyond the radius are reported with an out-of-range index
+        found = indices < len(self)
+        neighbour_speeds = np.full(indices.shape, np.nan)
+        neighbour_speeds[found] = filled[indices[found]]
+        usable = found & ~np.isnan(neighbour_speeds)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weights = np.where(usable, 1.0 / np.maximum(_chord_to_km(chords), 1e-6), 0)
+            weighted_sum = np.nansum(weights * np.nan_to_num(neighbour_speeds), axis=1)
+            estimates = weighted_sum / weights.sum(axis=1)
+
+        filled[missing] = estimates  # Stays NaN when there were no usable neighbours
+        return filled
+
+    def wake_loss_factors(
+        self,
+        capacities: np.ndarray,
+        radius_km: float = DEFAULT_WAKE_RADIUS_KM,
+        loss_coefficient: float = DEFAULT_WAKE_LOSS_COEFFICIENT,
+        max_loss: float = DEFAULT_MAX_WAKE_LOSS,
+    ) -> np.ndarray:
+        """
+        Estimate the fraction of power lost by each farm due to wakes of its neighbours
+
+        Simplified model without wind direction: every neighbour within the radius
+        takes a share of the output which grows with its relative size and shrinks
+        linearly with distance.
+
+        Args:
+            capacities: Overall capacities in MW aligned with the index
+            radius_km: Neighbours further away do not cause wake losses
+            loss_coefficient: Loss caused by an equally sized farm at zero distance
+            max_loss: Upper bound of the total loss for a single farm
+
+        Returns:
+            Loss fractions between 0 and `max_loss` for each farm
+        """
+        capacities = np.asarray(capacities, dtype=float)
+        losses = np.zeros(len(self))
+
+        pairs = self._tree.query_pairs(r=_km_to_chord(radius_km), output_type="ndarray")
+        if len(pairs) == 0:
+            return losses
+
+        first, second = pairs[:, 0], pairs[:, 1]
+        chords = np.linalg.norm(self._points[first] - self._points[second], axis=1)
+        proximity = np.clip(1 - _chord_to_km(chords) / radius_km, 0, 1)
+
+        total_capacities = capacities[first] + capacities[second]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            first_share = np.where(
+                total_capacities > 0, capacities[second] / total_capacities, 0
+            )
+        second_share = np.where(total_capacities > 0, 1 - first_share, 0)
+
+        # Each pair shades both farms, the smaller one more than the bigger one
+        np.add.at(losses, first, 2 * loss_coefficient * first_share * proximity)
+        np.add.at(losses, second, 2 * loss_coefficient * second_share * proximity)
+
+        return np.minimum(losses, max_loss)
+
+
+def _to_unit_vectors(latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    """Convert coordinates in degrees to 3D points on the unit sphere"""
+    lat = np.radians(np.asarray(latitudes, dtype=float))
+    lon = np.radians(np.asarray(longitudes, dtype=float))
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)))
+
+
+def _km_to_chord(distance_km: float) -> float:
+    """Convert a great-circle distance to the chord length on the unit sphere"""
+    angle = min(distance_km / EARTH_RADIUS_KM, np.pi)
+    return 2 * np.sin(angle / 2)
+
+
+def _chord_to_km(chords: np.ndarray) -> np.ndarray:
+    """Convert chord lengths on the unit sphere to great-circle distances"""
+    with np.errstate(invalid="ignore"):
+        return 2 * EARTH_RADIUS_KM * np.arcsin(np.clip(chords / 2, 0, 1))
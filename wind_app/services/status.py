@@ -0,0 +1,40 @@
+"""
+Status Module
+
+In-memory state of the app used by health checks. Kept free of heavy
+dependencies and I/O, so probes can read it in microseconds.
+"""
+
+import threading
+import time
+
+
+class DashboardStatus:
+    """Tracks when dashboard data was last refreshed and how long it took"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._last_refresh_at: float | None = None
+        self._last_refresh_duration: float | None = None
+
+    def record_refresh(self, duration_seconds: float) -> None:
+        """Remember a refresh of dashboard data which obtained weather data"""
+        with self._lock:
+            self._last_refresh_at = time.monotonic()
+            self._last_refresh_duration = duration_seconds
+
+    @property
+    def snapshot_age_seconds(self) -> float | None:
+        """Seconds since the last successful refresh, None if there was none"""
+        last_refresh_at = self._last_refresh_at
+        if last_refresh_at is None:
+            return None
+        return time.monotonic() - last_refresh_at
+
+    @property
+    def last_refresh_duration_seconds(self) -> float | None:
+        """Duration of the last successful refresh, None if there was none"""
+        return self._last_refresh_duration
+
+
+dashboard_status = DashboardStatus()  # Shared by all requests of the process
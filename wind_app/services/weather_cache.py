@@ -0,0 +1,342 @@
+"""
+Weather Cache Module
+
+Persistent cache for wind speeds fetched from the weather API. Data is kept
+in a SQLite database on local disk, so it survives restarts and is shared by
+all worker processes on the machine:
+
+- entries older than the TTL are treated as missing
+- the number of entries is bounded, the oldest ones are evicted first
+- short-lived leases let one process fetch a location while the others wait
+  for its result instead of calling the API themselves
+
+Each cache holds a single connection guarded by a lock, opened once and
+closed by `close`. Batch methods look up or store many locations in one
+statement, so a dashboard render costs a handful of queries, not a few per farm.
+
+Example:
+    cache = WeatherCache("data/weather_cache.sqlite3", ttl_seconds=600)
+    cache.set(56.6, 11.21, 10.5)
+    wind_speed = cache.get(56.6, 11.21)
+    wind_speeds = cache.get_many([(56.6, 11.21), (56.6, 12.46)])
+    cache.close()
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Mapping
+
+from wind_app.utils import log
+
+DEFAULT_CACHE_PATH = "data/weather_cache.sqlite3"
+
+Coordinates = tuple[float, float]
+
+# Locations per statement, below the SQLite limit of bound parameters
+_BATCH_SIZE = 500
+
+
+class WeatherCache:
+    """SQLite backed wind speed cache with TTL and size bounds"""
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        ttl_seconds: float = 600,
+        max_entries: int = 10_000,
+        lease_seconds: float = 15,
+    ) -> None:
+        """
+        Initialize the cache, creating the database file if needed
+
+        Args:
+            path: Location of the SQLite database file
+            ttl_seconds: How long a cached wind speed stays valid
+            max_entries: Maximum number of cached locations
+            lease_seconds: How long a process may hold a location it is fetching
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.lease_seconds = lease_seconds
+
+        # Number of cached locations as of the last write of this process,
+        # lets health checks report the fill level without touching the disk
+        self.entries = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # One connection shared by all threads, the lock serializes its use
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=5, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")  # Readers never block
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+
+        with self._lock, self._connection as connection:
+            connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS wind_speeds (
+                    location TEXT PRIMARY KEY,
+                    wind_speed REAL NOT NULL,
+                    fetched_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS wind_speeds_fetched_at
+                    ON wind_speeds (fetched_at);
+                CREATE TABLE IF NOT EXISTS leases (
+                    location TEXT PRIMARY KEY,
+                    expires_at REAL NOT NULL
+                );
+                """
+            )
+            self.entries = self._count_entries(connection)
+
+    def close(self) -> None:
+        """Close the database connection, the cache cannot be used afterwards"""
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "WeatherCache":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def get(self, latitude: float, longitude: float) -> float | None:
+        """
+        Get a cached wind speed for coordinates
+
+        Returns:
+            Wind speed in meters per second, or None if missing or expired
+        """
+        return self.get_many([(latitude, longitude)]).get((latitude, longitude))
+
+    def get_many(self, coordinates: Iterable[Coordinates]) -> dict[Coordinates, float]:
+        """
+        Get cached wind speeds for many coordinates at once
+
+        Returns:
+            Wind speeds in meters per second by coordinates, missing or
+            expired coordinates are left out
+        """
+        locations = _locations(coordinates)
+        if not locations:
+            return {}
+
+        fresh_after = time.time() - self.ttl_seconds
+        try:
+            with self._lock:
+                rows = [
+                    row
+                    for batch in _batches(list(locations))
+                    for row in self._connection.execute(
+                        "SELECT location, wind_speed FROM wind_speeds"
+                        f" WHERE location IN ({_placeholders(batch)})"
+                        " AND fetched_at >= ?",
+                        (*batch, fresh_after),
+                    )
+                ]
+        except sqlite3.Error as error:
+            log(f"❌ Weather cache read failed: {error}")
+            return {}
+
+        wind_speeds = dict(rows)
+        return {
+            point: wind_speeds[location]
+            for location, points in locations.items()
+            if location in wind_speeds
+            for point in points
+        }
+
+    def set(self, latitude: float, longitude: float, wind_speed: float) -> None:
+        """Store a wind speed for coordinates and evict entries over the bounds"""
+        self.set_many({(latitude, longitude): wind_speed})
+
+    def set_many(self, wind_speeds: Mapping[Coordinates, float]) -> None:
+        """Store wind speeds for many coordinates and evict entries over the bounds"""
+        if not wind_speeds:
+            return
+
+        now = time.time()
+        rows = [
+            (_location(latitude, longitude), wind_speed, now)
+            for (latitude, longitude), wind_speed in wind_speeds.items()
+        ]
+        try:
+            with self._lock, self._connection as connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO wind_speeds VALUES (?, ?, ?)", rows
+                )
+                connection.execute(
+                    "DELETE FROM wind_speeds WHERE fetched_at < ?",
+                    (now - self.ttl_seconds,),
+                )
+                connection.execute(
+                    "DELETE FROM wind_speeds WHERE location IN ("
+                    " SELECT location FROM wind_speeds"
+                    " ORDER BY fetched_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+                self.entries = self._count_entries(connection)
+        except sqlite3.Error as error:
+            log(f"❌ Weather cache write failed: {error}")
+
+    @property
+    def fill_level(self) -> float:
+        """Fraction of the maximum number of entries in use"""
+        return self.entries / self.max_entries if self.max_entries > 0 else 1.0
+
+    def acquire_lease(self, latitude: float, longitude: float) -> bool:
+        """
+        Try to become the only process fetching the coordinates
+
+        Returns:
+            True if the lease was acquired, False if another process holds it
+        """
+        return bool(self.acquire_leases([(latitude, longitude)]))
+
+    def acquire_leases(self, coordinates: Iterable[Coordinates]) -> list[Coordinates]:
+        """
+        Try to become the only process fetching each of the coordinates
+
+        Returns:
+            Coordinates whose lease was acquired, the others are held by
+            another process
+        """
+        locations = _locations(coordinates)
+        now = time.time()
+        acquired = []
+        try:
+            with self._lock, self._connection as connection:
+                connection.execute("DELETE FROM leases WHERE expires_at < ?", (now,))
+                for location, points in locations.items():
+                    cursor = connection.execute(
+                        "INSERT OR IGNORE INTO leases VALUES (?, ?)",
+                        (location, now + self.lease_seconds),
+                    )
+                    if cursor.rowcount == 1:
+                        acquired.extend(points)
+        except sqlite3.Error as error:
+            log(f"❌ Weather cache lease failed: {error}")
+            # Fetch anyway rather than wait for a broken cache
+            return [point for points in locations.values() for point in points]
+
+        return acquired
+
+    def release_lease(self, latitude: float, longitude: float) -> None:
+        """Let other processes fetch the coordinates again"""
+        self.release_leases([(latitude, longitude)])
+
+    def release_leases(self, coordinates: Iterable[Coordinates]) -> None:
+        """Let other processes fetch the coordinates again"""
+        locations = list(_locations(coordinates))
+        if not locations:
+            return
+
+        try:
+            with self._lock, self._connection as connection:
+                for batch in _batches(locations):
+                    connection.execute(
+                        f"DELETE FROM leases WHERE location IN ({_placeholders(batch)})",
+                        batch,
+                    )
+        except sqlite3.Error as error:
+            log(f"❌ Weather cache lease release failed: {error}")
+
+    def wait_for(
+        self, latitude: float, longitude: float, poll_interval: float = 0.05
+    ) -> float | None:
+        """
+        Wait for another process to cache the coordinates
+
+        Returns:
+            Cached wind speed, or None if the other process released or lost
+            the lease without caching anything
+        """
+        return self.wait_for_many([(latitude, longitude)], poll_interval).get(
+            (latitude, longitude)
+        )
+
+    def wait_for_many(
+        self, coordinates: Iterable[Coordinates], poll_interval: float = 0.05
+    ) -> dict[Coordinates, float]:
+        """
+        Wait for other processes to cache the coordinates
+
+        Returns:
+            Cached wind speeds by coordinates, coordinates whose lease was
+            released or lost without caching anything are left out
+        """
+        pending = set(coordinates)
+        wind_speeds: dict[Coordinates, float] = {}
+        deadline = time.monotonic() + self.lease_seconds
+
+        while pending and time.monotonic() < deadline:
+            found = self.get_many(pending)
+            wind_speeds.update(found)
+            pending = set(self._leased(pending.difference(found)))
+            if pending:
+                time.sleep(poll_interval)
+
+        return wind_speeds
+
+    def _leased(self, coordinates: Iterable[Coordinates]) -> list[Coordinates]:
+        """Coordinates for which some process holds a valid lease"""
+        locations = _locations(coordinates)
+        if not locations:
+            return []
+
+        now = time.time()
+        try:
+            with self._lock:
+                leased = {
+                    row[0]
+                    for batch in _batches(list(locations))
+                    for row in self._connection.execute(
+                        "SELECT location FROM leases"
+                        f" WHERE location IN ({_placeholders(batch)})"
+                        " AND expires_at >= ?",
+                        (*batch, now),
+                    )
+                }
+        except sqlite3.Error:
+            return []
+
+        return [
+            point
+            for location, points in locations.items()
+            if location in leased
+            for point in points
+        ]
+
+    def _count_entries(self, connection: sqlite3.Connection) -> int:
+        """Count cached locations"""
+        return connection.execute("SELECT COUNT(*) FROM wind_speeds").fetchone()[0]
+
+
+def _location(latitude: float, longitude: float) -> str:
+    """Cache key for coordinates, about 10 m precision"""
+    return f"{latitude:.4f},{longitude:.4f}"
+
+
+def _locations(coordinates: Iterable[Coordinates]) -> dict[str, list[Coordinates]]:
+    """Group coordinates by their cache key"""
+    locations: dict[str, list[Coordinates]] = {}
+    for latitude, longitude in dict.fromkeys(coordinates):
+        locations.setdefault(_location(latitude, longitude), []).append(
+            (latitude, longitude)
+        )
+    return locations
+
+
+def _batches(locations: list[str]) -> Iterable[list[str]]:
+    """Split locations into batches bound as parameters of a single statement"""
+    for start in range(0, len(locations), _BATCH_SIZE):
+        yield locations[start : start + _BATCH_SIZE]
+
+
+def _placeholders(batch: list[str]) -> str:
+    return ", ".join("?" * len(batch))
@@ -5,36 +5,53 @@ Handles integration with OpenWeatherMap API to fetch real-time weather data
 for wind farm locations. Provides wind speed, direction and temperature data
 for power generation calculations.
 
+Wind speeds can be kept in a persistent `WeatherCache` shared by worker processes.
+
 Example:
-    service = WeatherService()
-    weather_data = service.get_weather_data(56.6, 11.21)
+    service = WeatherService(cache=WeatherCache())
+    wind_speed = service.get_current_wind_speed(56.6, 11.21)
+    wind_speed = await service.get_current_wind_speed_async(56.6, 11.21)
+    wind_speeds = await service.get_current_wind_speeds_async(
+        [(56.6, 11.21), (56.6, 12.46)]
+    )
 """
 
+import asyncio
+import os
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
+from functools import cache
+
 import httpx
 
+from wind_app.services.circuit_breaker import CircuitBreaker, weather_api_breaker
+from wind_app.services.single_flight import SingleFlight
+from wind_app.services.weather_cache import Coordinates, WeatherCache
 from wind_app.utils import log
 
-# NOTE: This import is used to load the API key from private_config.py.
-#       If the file is not found and tests are not running - it raises an ImportError.
-try:
-    from wind_app.private_config import weather_api_key
-except ImportError:
-    import os
-
-    are_tests_running = os.getenv("PYTEST_VERSION") is not None
-
-    if not are_tests_running:
-        raise
-
-    weather_api_key = "some_not_existing_api_key_for_tests"
-
 
 class WeatherService:
     """Simple service for fetching wind speed data from OpenWeatherMap API"""
 
-    def __init__(self, http_client: httpx.Client | None = None) -> None:
-        """Initialize the weather service with API key validation"""
-        self.api_key = weather_api_key
+    def __init__(
+        self,
+        http_client: httpx.Client | None = None,
+        async_http_client: httpx.AsyncClient | None = None,
+        cache: WeatherCache | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+    ) -> None:
+        """
+        Initialize the weather service with API key validation
+
+        Args:
+            http_client: Client used by synchronous requests
+            async_http_client: Client used by asynchronous requests,
+                a short-lived client is opened per batch of requests if not provided
+            cache: Persistent cache of recently fetched wind speeds
+            circuit_breaker: Stops requests while the API keeps failing,
+                the breaker shared by the process is used if not provided
+        """
+        self.api_key = _load_weather_api_key()
         self.base_url = "https://api.openweathermap.org/data/2.5/weather"
 
         if http_client is None:
@@ -42,6 +59,12 @@ class WeatherService:
         else:
             self.http_client = http_client
 
+        self.async_http_client = async_http_client
+        self.cache = cache
+        self.circuit_breaker = (
+            circuit_breaker if circuit_breaker else weather_api_breaker
+        )
+
         # Check if API key is properly configured
         if self.api_key == "your_api_key_here":
             raise ValueError(
@@ -54,48 +77,307 @@ class WeatherService:
         """
         Get current wind speed for specific coordinates
 
+        Recently fetched values are served from the cache and concurrent
+        lookups for the same coordinates share one API request.
+
         Args:
             latitude: Location latitude (-90.0 to 90.0)
             longitude: Location longitude (-180.0 to 180.0)
 
         Returns:
-            Wind speed in meters per second, or 0 if request fails
+            Wind speed in meters per second, or None if request fails
         """
-        # Prepare API request parameters
-        request_params: dict[str, str | float] = {
-            "lat": latitude,
-            "lon": longitude,
-            "appid": self.api_key,
-            "units": "metric",  # Use metric units (m/s for wind speed)
-        }
+        if self.cache is not None:
+            wind_speed = self.cache.get(latitude, longitude)
+            if wind_speed is not None:
+                return wind_speed
+
+        return _wind_speed_requests.do(
+            (self.base_url, latitude, longitude),
+            lambda: self._fetch_wind_speed_through_cache(latitude, longitude),
+        )
+
+    async def get_current_wind_speed_async(
+        self, latitude: float, longitude: float
+    ) -> float | None:
+        """
+        Get current wind speed for specific coordinates without blocking the event loop
+
+        Recently fetched values are served from the cache and concurrent
+        lookups for the same coordinates share one API request.
+
+        Args:
+            latitude: Location latitude (-90.0 to 90.0)
+            longitude: Location longitude (-180.0 to 180.0)
+
+        Returns:
+            Wind speed in meters per second, or None if request fails
+        """
+        (wind_speed,) = await self.get_current_wind_speeds_async(
+            [(latitude, longitude)]
+        )
+        return wind_speed
+
+    async def get_current_wind_speeds_async(
+        self, coordinates: Iterable[Coordinates], max_concurrent_requests: int = 10
+    ) -> list[float | None]:
+        """
+        Get current wind speeds for many coordinates without blocking the event loop
+
+        The cache is read and written in batches, each in a single worker thread
+        call, and missing wind speeds are fetched concurrently over one client.
+
+        Args:
+            coordinates: Latitude and longitude pairs
+            max_concurrent_requests: Limit of API requests in flight at the same time
+
+        Returns:
+            Wind speeds in meters per second in the order of the coordinates,
+            None where the request fails
+        """
+        coordinates = list(coordinates)
+        wind_speeds: dict[Coordinates, float | None] = {}
+
+        if self.cache is not None and coordinates:
+            wind_speeds.update(
+                await asyncio.to_thread(self.cache.get_many, coordinates)
+            )
+
+        missing = [
+            point for point in dict.fromkeys(coordinates) if point not in wind_speeds
+        ]
+        if missing:
+            semaphore = asyncio.Semaphore(max_concurrent_requests)
+            async with self._open_async_http_client() as http_client:
+                wind_speeds.update(
+                    await self._fetch_wind_speeds_through_cache_async(
+                        missing, http_client, semaphore
+                    )
+                )
+
+        return [wind_speeds.get(point) for point in coordinates]
+
+    def _fetch_wind_speed_through_cache(
+        self, latitude: float, longitude: float
+    ) -> float | None:
+        """Fetch wind speed unless another process is already fetching it"""
+        if self.cache is None:
+            return self._fetch_wind_speed(latitude, longitude)
+
+        if self.cache.acquire_lease(latitude, longitude):
+            try:
+                return self._fetch_and_cache_wind_speed(latitude, longitude)
+            finally:
+                self.cache.release_lease(latitude, longitude)
+
+        # Another process is fetching the location, use its result if it succeeds
+        wind_speed = self.cache.wait_for(latitude, longitude)
+        if wind_speed is None:
+            wind_speed = self._fetch_and_cache_wind_speed(latitude, longitude)
+        return wind_speed
+
+    async def _fetch_wind_speeds_through_cache_async(
+        self,
+        coordinates: list[Coordinates],
+        http_client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+    ) -> dict[Coordinates, float | None]:
+        """Fetch wind speeds, except those another process is already fetching"""
+
+        async def fetch(points: list[Coordinates]) -> dict[Coordinates, float | None]:
+            return await self._fetch_wind_speeds_async(points, http_client, semaphore)
+
+        if self.cache is None:
+            return await fetch(coordinates)
+
+        leased = await asyncio.to_thread(self.cache.acquire_leases, coordinates)
+        wind_speeds: dict[Coordinates, float | None] = {}
+        try:
+            wind_speeds = await fetch(leased)
+        finally:
+            await asyncio.to_thread(self._cache_wind_speeds, wind_speeds, leased)
+
+        # Other processes are fetching the rest, use their results if they succeed
+        leased_points = set(leased)
+        leased_by_others = [
+            point for point in coordinates if point not in leased_points
+        ]
+        if leased_by_others:
+            wind_speeds.update(
+                await asyncio.to_thread(self.cache.wait_for_many, leased_by_others)
+            )
+            unresolved = [
+                point for point in leased_by_others if point not in wind_speeds
+            ]
+            if unresolved:
+                fetched = await fetch(unresolved)
+                await asyncio.to_thread(self._cache_wind_speeds, fetched, [])
+                wind_speeds.update(fetched)
+
+        return wind_speeds
+
+    def _cache_wind_speeds(
+        self,
+        wind_speeds: dict[Coordinates, float | None],
+        leased: list[Coordinates],
+    ) -> None:
+        """Store successfully fetched wind speeds and release the leases"""
+        if self.cache is None:
+            return
+        self.cache.set_many(
+            {
+                point: wind_speed
+                for point, wind_speed in wind_speeds.items()
+                if wind_speed is not None
+            }
+        )
+        self.cache.release_leases(leased)
+
+    def _fetch_and_cache_wind_speed(
+        self, latitude: float, longitude: float
+    ) -> float | None:
+        """Fetch wind speed and store successful results in the cache"""
+        wind_speed = self._fetch_wind_speed(latitude, longitude)
+        if wind_speed is not None and self.cache is not None:
+            self.cache.set(latitude, longitude, wind_speed)
+        return wind_speed
+
+    def _fetch_wind_speed(self, latitude: float, longitude: float) -> float | None:
+        """Request wind speed from the API"""
+        if not self._is_request_allowed():
+            return None
 
         try:
             # Make API request
             response = self.http_client.get(
-                self.base_url, params=request_params, timeout=10
+                self.base_url,
+                params=self._get_request_params(latitude, longitude),
+                timeout=10,
             )
-            response.raise_for_status()  # Raise exception for HTTP errors
+            return self._read_wind_speed(response, latitude, longitude)
+
+        except Exception as error:
+            return self._handle_error(error)
 
-            # TODO: use LLM to prepare data model for the response
-            # .      Implement WeatherData class inheriting from typing.TypedDict
-            # .      and use it as type of weather_data variable
-            # .      This will allow to use IDE autocompletion and type checking
+    async def _fetch_wind_speeds_async(
+        self,
+        coordinates: list[Coordinates],
+        http_client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+    ) -> dict[Coordinates, float | None]:
+        """Request wind speeds concurrently, lookups in flight in the process are shared"""
 
-            # Parse JSON response
-            weather_data = response.json()
-            wind_speed = weather_data["wind"]["speed"]
+        async def fetch(latitude: float, longitude: float) -> float | None:
+            async with semaphore:
+                return await _wind_speed_requests.do_async(
+                    (self.base_url, latitude, longitude),
+                    lambda: self._fetch_wind_speed_async(
+                        latitude, longitude, http_client
+                    ),
+                )
 
-            log(f"✅ Wind speed for ({latitude}, {longitude}): {wind_speed} m/s")
-            return wind_speed
+        wind_speeds = await asyncio.gather(
+            *(fetch(latitude, longitude) for latitude, longitude in coordinates)
+        )
+        return dict(zip(coordinates, wind_speeds))
 
-        except httpx.RequestError as error:
-            log(f"❌ Weather API request failed: {error}")
-            return None
+    @asynccontextmanager
+    async def _open_async_http_client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Use the injected client or a short-lived one for a batch of requests"""
+        if self.async_http_client is not None:
+            yield self.async_http_client
+            return
 
-        except KeyError:
-            log("❌ Wind data not found in weather response")
+        async with httpx.AsyncClient() as http_client:
+            yield http_client
+
+    async def _fetch_wind_speed_async(
+        self, latitude: float, longitude: float, http_client: httpx.AsyncClient
+    ) -> float | None:
+        """Request wind speed from the API without blocking the event loop"""
+        if not self._is_request_allowed():
             return None
 
+        try:
+            response = await http_client.get(
+                self.base_url,
+                params=self._get_request_params(latitude, longitude),
+                timeout=10,
+            )
+            return self._read_wind_speed(response, latitude, longitude)
+
         except Exception as error:
+            return self._handle_error(error)
+
+    def _get_request_params(
+        self, latitude: float, longitude: float
+    ) -> dict[str, str | float]:
+        """Prepare API request parameters"""
+        return {
+            "lat": latitude,
+            "lon": longitude,
+            "appid": self.api_key,
+            "units": "metric",  # Use metric units (m/s for wind speed)
+        }
+
+    def _read_wind_speed(
+        self, response: httpx.Response, latitude: float, longitude: float
+    ) -> float:
+        """Extract wind speed from the API response"""
+        response.raise_for_status()  # Raise exception for HTTP errors
+        self.circuit_breaker.record_success()
+
+        # TODO: use LLM to prepare data model for the response
+        # .      Implement WeatherData class inheriting from typing.TypedDict
+        # .      and use it as type of weather_data variable
+        # .      This will allow to use IDE autocompletion and type checking
+
+        # Parse JSON response
+        weather_data = response.json()
+        wind_speed = weather_data["wind"]["speed"]
+
+        log(f"✅ Wind speed for ({latitude}, {longitude}): {wind_speed} m/s")
+        return wind_speed
+
+    def _is_request_allowed(self) -> bool:
+        """Check the circuit breaker before calling the API"""
+        if self.circuit_breaker.allow_request():
+            return True
+
+        log("⛔ Weather API is failing, skipping request until it recovers")
+        return False
+
+    def _handle_error(self, error: Exception) -> None:
+        """Log a failed wind speed lookup"""
+        # Missing wind data comes from a successful response, everything else
+        # means the API is not usable at the moment
+        if not isinstance(error, KeyError):
+            self.circuit_breaker.record_failure()
+
+        if isinstance(error, httpx.RequestError):
+            log(f"❌ Weather API request failed: {error}")
+        elif isinstance(error, KeyError):
+            log("❌ Wind data not found in weather response")
+        else:
             log(f"❌ Unexpected error getting wind speed: {error}")
-            return None
+        return None
+
+
+@cache
+def _load_weather_api_key() -> str:
+    """Load the API key from private_config.py on first use rather than at import"""
+    # NOTE: If the file is not found and tests are not running - it raises an ImportError.
+    try:
+        from wind_app.private_config import weather_api_key
+    except ImportError:
+        are_tests_running = os.getenv("PYTEST_VERSION") is not None
+
+        if not are_tests_running:
+            raise
+
+        weather_api_key = "some_not_existing_api_key_for_tests"
+
+    return weather_api_key
+
+
+_wind_speed_requests = SingleFlight()  # Shared by all weather services in the process
@@ -10,18 +10,29 @@ Features:
 - Power generation estimates
 - Performance analytics
 - Country-level statistics
+- Optional wake losses and gap filling based on neighbouring farms
+- Concurrent dashboard requests share one computation
+- Farm data is loaded once and kept in a compact `WindFarmRegistry`
 """
 
+import asyncio
+import threading
+from collections.abc import Hashable, Iterable, Iterator, Mapping
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
-from pandas import DataFrame
 
+from wind_app.profiling import is_profiling, profile_stage
+from wind_app.services.single_flight import SingleFlight
 from wind_app.services.weather_service import WeatherService
+from wind_app.services.wind_farm_registry import WindFarmRegistry, WindFarmView
 from wind_app.services.wind_farm_service.interface import AbstractWindFarmService
 from wind_app.utils import log
 
+if TYPE_CHECKING:
+    from wind_app.services.spatial_index import WindFarmSpatialIndex
+
 
 class WindFarmDashboard:
     """
@@ -35,75 +46,235 @@ class WindFarmDashboard:
         self,
         wind_farm_service: AbstractWindFarmService,
         weather_service: WeatherService | None = None,
+        spatial_adjustments: bool = False,
+        max_concurrent_weather_requests: int = 10,
     ) -> None:
         """
         Initialize the wind farm dashboard
 
         Args:
-            data_file_path: Path to the Excel file containing wind farm data
+            wind_farm_service: Service providing wind farm data
+            weather_service: Service providing current wind speeds
+            spatial_adjustments: Fill missing wind speeds from nearby farms
+                and apply wake losses to estimated power
+            max_concurrent_weather_requests: Limit of weather requests in flight
+                at the same time in the asynchronous processing
         """
         self._wind_farm_service = wind_farm_service
         self._weather_service = weather_service if weather_service else WeatherService()
+        self._spatial_adjustments = spatial_adjustments
+        self._max_concurrent_weather_requests = max_concurrent_weather_requests
 
-    def process_wind_farm_data(self, wind_farm_data: DataFrame) -> None:
-        """Add real-time weather information to wind farm data"""
-        log("📊 Loading wind farm data...")
+    def _fetch_wind_speeds(self, registry: WindFarmRegistry) -> np.ndarray:
+        """Get current wind speeds of all farms, NaN where the lookup failed"""
+        log("🌤️  Fetching real-time weather data...")
 
-        if wind_farm_data.empty:
-            log("❌ No wind farm data loaded")
-            return
+        with profile_stage("weather"):
+            return _to_wind_speed_array(
+                self._weather_service.get_current_wind_speed(
+                    farm.latitude, farm.longitude
+                )
+                for farm in registry
+            )
 
-        log(f"✅ Loaded {len(wind_farm_data)} wind farms")
+    async def _fetch_wind_speeds_async(self, registry: WindFarmRegistry) -> np.ndarray:
+        """Get current wind speeds of all farms concurrently, NaN where the lookup failed"""
         log("🌤️  Fetching real-time weather data...")
 
-        # Add current wind speeds for each farm
-        wind_farm_data["Current wind speed"] = wind_farm_data.apply(
-            lambda farm: self._weather_service.get_current_wind_speed(
-                farm["Latitude"], farm["Longitude"]
-            ),
-            axis=1,
-        )
+        with profile_stage("weather"):
+            return _to_wind_speed_array(
+                await self._weather_service.get_current_wind_speeds_async(
+                    [(farm.latitude, farm.longitude) for farm in registry],
+                    max_concurrent_requests=self._max_concurrent_weather_requests,
+                )
+            )
+
+    def _estimate_power(
+        self, registry: WindFarmRegistry, wind_speeds: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate estimated power output, applying spatial adjustments if enabled
+
+        Returns:
+            Tuple of wind speeds (with gaps filled from nearby farms if enabled)
+            and estimated power outputs, NaN where missing
+        """
+        spatial_index = None
+        if self._spatial_adjustments:
+            # Imported here as scipy is only needed for spatial adjustments
+            from wind_app.services.spatial_index import WindFarmSpatialIndex
+
+            spatial_index = WindFarmSpatialIndex(
+                latitudes=registry.latitudes, longitudes=registry.longitudes
+            )
+            wind_speeds = self._fill_missing_wind_speeds(wind_speeds, spatial_index)
 
         # Calculate estimated power output based on wind speeds
         log("⚡ Calculating power output...")
-        wind_farm_data["Estimated power"] = wind_farm_data.apply(
-            lambda farm: self.calculate_turbine_power(
-                wind_speed=farm["Current wind speed"],
-                max_capacity=farm["Overall capacity"],
-            )
-            if farm["Current wind speed"] is not None
-            else None,
-            axis=1,
+        estimated_power = self.calculate_turbine_power_vectorized(
+            wind_speeds=wind_speeds, max_capacities=registry.overall_capacities
         )
 
+        if spatial_index is not None:
+            log("🌀 Applying wake losses...")
+            estimated_power *= 1 - spatial_index.wake_loss_factors(
+                registry.overall_capacities.astype(float)
+            )
+
         log("✅ Data processing complete!")
+        return wind_speeds, estimated_power
+
+    def _fill_missing_wind_speeds(
+        self, wind_speeds: np.ndarray, spatial_index: "WindFarmSpatialIndex"
+    ) -> np.ndarray:
+        """Borrow wind speeds from nearby farms where the weather request failed"""
+        filled = spatial_index.fill_missing_wind_speeds(wind_speeds)
+
+        filled_count = int(np.isnan(wind_speeds).sum() - np.isnan(filled).sum())
+        if filled_count:
+            log(f"🧭 Filled {filled_count} missing wind speeds from nearby farms")
+
+        return filled
 
     def get_dashboard_data(self) -> dict[str, Any]:
         """
         Get all formatted data needed for the dashboard display
 
+        Concurrent calls for the same data source share one computation and
+        get the same dictionary, callers must treat it as read-only. Profiled
+        requests compute their own data, so their profile shows every stage.
+
         Returns:
             Dictionary with all dashboard data ready for templates
         """
+        if is_profiling():
+            return self._load_dashboard_data()
+        return _dashboard_requests.do(
+            self._get_request_key(), self._load_dashboard_data
+        )
+
+    def _load_dashboard_data(self) -> dict[str, Any]:
+        """Load, process and format dashboard data"""
+        registry = self._load_wind_farm_registry()
+        if registry is None:
+            return self.get_empty_dashboard_data()
+
+        wind_speeds = self._fetch_wind_speeds(registry)
+        with profile_stage("power"):
+            wind_speeds, estimated_power = self._estimate_power(registry, wind_speeds)
+
+        with profile_stage("format"):
+            return self._format_dashboard_data(registry, wind_speeds, estimated_power)
+
+    async def get_dashboard_data_async(self) -> dict[str, Any]:
+        """
+        Get all formatted data needed for the dashboard display without blocking the event loop
 
-        # Load base wind farm data from Excel
-        wind_farm_data = self._wind_farm_service.load_wind_farm_data()
-        self.process_wind_farm_data(wind_farm_data=wind_farm_data)
+        Concurrent calls for the same data source share one computation and
+        get the same dictionary, callers must treat it as read-only. Profiled
+        requests compute their own data, so their profile shows every stage.
 
-        # If still no data, return empty dashboard
-        if wind_farm_data is None or wind_farm_data.empty:
+        Returns:
+            Dictionary with all dashboard data ready for templates
+        """
+        if is_profiling():
+            return await self._load_dashboard_data_async()
+        return await _dashboard_requests.do_async(
+            self._get_request_key(), self._load_dashboard_data_async
+        )
+
+    async def _load_dashboard_data_async(self) -> dict[str, Any]:
+        """Load, process and format dashboard data without blocking the event loop"""
+        registry = _wind_farm_registries.get(self._wind_farm_service.source_key)
+        if registry is None:
+            # Load base wind farm data from Excel in a worker thread
+            registry = await asyncio.to_thread(self._load_wind_farm_registry)
+        if registry is None:
             return self.get_empty_dashboard_data()
 
-        # Calculate country statistics
-        country_stats = self._calculate_country_statistics(wind_farm_data)
+        wind_speeds = await self._fetch_wind_speeds_async(registry)
+        with profile_stage("power"):
+            wind_speeds, estimated_power = self._estimate_power(registry, wind_speeds)
+
+        with profile_stage("format"):
+            return self._format_dashboard_data(registry, wind_speeds, estimated_power)
+
+    def _load_wind_farm_registry(self) -> WindFarmRegistry | None:
+        """
+        Get the registry of the wind farm data source, loading it on first use
+
+        Returns:
+            Registry shared by all dashboards of the data source, or None if
+            no wind farm data could be loaded
+        """
+        source_key = self._wind_farm_service.source_key
+        registry = _wind_farm_registries.get(source_key)
+        if registry is not None:
+            return registry
+
+        log("📊 Loading wind farm data...")
+        with profile_stage("load"):
+            wind_farm_data = self._wind_farm_service.load_wind_farm_data()
+            if wind_farm_data.empty:
+                log("❌ No wind farm data loaded")
+                return None  # Not kept, the next request tries again
+            registry = WindFarmRegistry.from_dataframe(wind_farm_data)
+
+        log(
+            f"✅ Loaded {len(registry)} wind farms"
+            f" into {registry.memory_footprint()} bytes"
+        )
+        with _wind_farm_registries_lock:
+            # Drop the oldest registry, e.g. of a data file that was replaced
+            if len(_wind_farm_registries) >= _MAX_WIND_FARM_REGISTRIES:
+                del _wind_farm_registries[next(iter(_wind_farm_registries))]
+            _wind_farm_registries[source_key] = registry
+        return registry
+
+    def _get_request_key(self) -> tuple[Any, ...]:
+        """Key under which concurrent dashboard computations are coalesced"""
+        # Dashboards using different weather services (cache, breaker, client)
+        # may see different wind speeds, so they never share a result
+        return (
+            "dashboard",
+            self._wind_farm_service.source_key,
+            id(self._weather_service),
+            self._spatial_adjustments,
+        )
+
+    def _format_dashboard_data(
+        self,
+        registry: WindFarmRegistry,
+        wind_speeds: np.ndarray,
+        estimated_power: np.ndarray,
+    ) -> dict[str, Any]:
+        """Format processed wind farm data into dashboard sections"""
+        # Missing power counts as no generation in the totals
+        generation = np.nan_to_num(estimated_power, nan=0.0)
+        capacities = registry.overall_capacities.astype(float)
+
+        country_stats = self._calculate_country_statistics(
+            registry, capacities, generation
+        )
 
         # Prepare all dashboard sections
         return {
-            "wind_farms": self._prepare_wind_farm_cards(wind_farm_data),
+            "wind_farms": [
+                WindFarmCard(farm, wind_speed, power)
+                for farm, wind_speed, power in zip(
+                    registry, wind_speeds.tolist(), estimated_power.tolist()
+                )
+            ],
             "country_performance": self._prepare_country_cards(country_stats),
-            "fleet_summary": self._calculate_fleet_summary(wind_farm_data),
+            "fleet_summary": self._calculate_fleet_summary(
+                total_capacity=float(capacities.sum()),
+                total_generation=float(generation.sum()),
+            ),
             "status_metrics": self._get_status_metrics(
-                country_stats=country_stats, wind_farm_data=wind_farm_data
+                country_stats=country_stats,
+                active_farms=len(registry),
+                farms_reporting=int(np.count_nonzero(~np.isnan(wind_speeds))),
+                total_capacity=float(capacities.sum()),
             ),
         }
 
@@ -116,8 +287,12 @@ class WindFarmDashboard:
             max_capacity: Maximum power capacity in MW
 
         Returns:
-            Estimated power output in MW
+            Estimated power output in MW, NaN if the wind speed is NaN (missing)
         """
+        # Missing wind speed gives missing power, not the fallback full capacity
+        if wind_speed is not None and np.isnan(wind_speed):
+            return np.nan
+
         # Handle missing or invalid wind speed
         if not wind_speed or wind_speed <= 0:
             return 0.0
@@ -156,69 +331,50 @@ class WindFarmDashboard:
 
             return max_capacity  # Fallback for 10-12 m/s range
 
+    @staticmethod
+    def calculate_turbine_power_vectorized(
+        wind_speeds: np.ndarray, max_capacities: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate estimated power output for many wind speeds at once
+
+        Uses the same power curve as `calculate_turbine_power`.
+
+        Args:
+            wind_speeds: Wind speeds in m/s, NaN when missing
+            max_capacities: Maximum power capacities in MW
+
+        Returns:
+            Estimated power outputs in MW, NaN where the wind speed is missing
+        """
+        wind_speeds = np.asarray(wind_speeds, dtype=float)
+        power_factors = np.interp(
+            wind_speeds, _POWER_CURVE_SPEEDS, _POWER_CURVE_FACTORS, left=0.0, right=1.0
+        )
+        power_factors[wind_speeds > _CUT_OUT_SPEED] = 0.0  # Safety shutdown
+        power_factors[np.isnan(wind_speeds)] = np.nan
+        return power_factors * np.asarray(max_capacities, dtype=float)
+
     def _calculate_country_statistics(
-        self, wind_farm_data: DataFrame
-    ) -> dict[Any, Any]:
+        self,
+        registry: WindFarmRegistry,
+        capacities: np.ndarray,
+        generation: np.ndarray,
+    ) -> dict[str, dict[str, float]]:
         """Calculate aggregated statistics by country"""
-        fixed_wind_farm_data = wind_farm_data.copy()
-        fixed_wind_farm_data["Estimated power"].replace(
-            to_replace=np.nan, value=0, inplace=True
+        countries = registry.countries
+        country_capacities = np.bincount(
+            registry.country_codes, weights=capacities, minlength=len(countries)
         )
-        return (
-            fixed_wind_farm_data.groupby("Country")
-            .agg({"Overall capacity": "sum", "Estimated power": "sum"})
-            .to_dict("index")
+        country_generation = np.bincount(
+            registry.country_codes, weights=generation, minlength=len(countries)
         )
-
-    def _prepare_wind_farm_cards(
-        self, wind_farm_data: DataFrame
-    ) -> list[dict[str, Any]]:
-        """Prepare individual wind farm cards with formatted data"""
-        wind_farm_cards = []
-
-        for _, farm in wind_farm_data.iterrows():
-            # Get values with safe defaults
-            current_wind_speed = farm.get("Current wind speed", None)
-            estimated_power = farm.get("Estimated power", None)
-            overall_capacity = farm.get("Overall capacity", 0) or 0
-
-            # Calculate efficiency percentage
-            efficiency = (
-                (
-                    (estimated_power / overall_capacity * 100)
-                    if overall_capacity > 0
-                    else 0
-                )
-                if estimated_power is not None
-                else None
+        return {
+            country: {"Overall capacity": capacity, "Estimated power": power}
+            for country, capacity, power in zip(
+                countries, country_capacities.tolist(), country_generation.tolist()
             )
-
-            # Prepare card data
-            farm_card = {
-                "name": farm.get("Name", "Unknown"),
-                "country": farm.get("Country", "Unknown"),
-                "current_wind_speed": round(current_wind_speed, 1)
-                if current_wind_speed is not None
-                else _NO_DATA_SYMBOL,
-                "estimated_power": round(estimated_power, 1)
-                if estimated_power is not None
-                else _NO_DATA_SYMBOL,
-                "overall_capacity": round(overall_capacity, 0),
-                "number_of_turbines": int(farm.get("Number of turbines", 0)),
-                "efficiency": round(efficiency, 1)
-                if efficiency is not None
-                else _NO_DATA_SYMBOL,
-                "performance_rating": self.get_performance_rating(efficiency)
-                if efficiency is not None
-                else _NO_DATA_SYMBOL,
-                "progress_width": min(round(efficiency, 1), 100)
-                if efficiency is not None
-                else _NO_DATA_SYMBOL,
-            }
-
-            wind_farm_cards.append(farm_card)
-
-        return wind_farm_cards
+        }
 
     def _prepare_country_cards(self, country_stats) -> list[dict[str, Any]]:
         """Prepare country performance cards"""
@@ -250,21 +406,18 @@ class WindFarmDashboard:
 
         return country_cards
 
-    def _calculate_fleet_summary(self, wind_farm_data: DataFrame) -> dict[str, Any]:
+    def _calculate_fleet_summary(
+        self, *, total_capacity: float, total_generation: float
+    ) -> dict[str, Any]:
         """Calculate fleet-wide summary metrics"""
-        total_capacity = wind_farm_data["Overall capacity"].sum()
-        total_generation = wind_farm_data["Estimated power"].fillna(0).sum()
-
         # Calculate fleet efficiency
         fleet_efficiency = (
             (total_generation / total_capacity * 100) if total_capacity > 0 else 0
         )
 
         # Calculate environmental impact estimates
-        co2_avoided_per_hour = total_generation * 0.82  # tons CO2 per MWh
-        homes_powered = (
-            total_generation * 1000
-        ) / 2.5  # Average home consumption 2.5 kW
+        co2_avoided_per_hour = total_generation * CO2_AVOIDED_PER_MWH
+        homes_powered = (total_generation * 1000) / AVERAGE_HOME_CONSUMPTION_KW
 
         return {
             "total_capacity": round(total_capacity, 1),
@@ -276,17 +429,24 @@ class WindFarmDashboard:
         }
 
     def _get_status_metrics(
-        self, *, country_stats, wind_farm_data: DataFrame
+        self,
+        *,
+        country_stats,
+        active_farms: int,
+        farms_reporting: int,
+        total_capacity: float,
     ) -> dict[str, Any]:
         """Get metrics for the status bar"""
         return {
-            "active_farms": len(wind_farm_data),
+            "active_farms": active_farms,
+            "farms_reporting": farms_reporting,  # Farms with a known wind speed
             "countries": len(country_stats),
-            "total_capacity": round(wind_farm_data["Overall capacity"].sum(), 1),
+            "total_capacity": round(total_capacity, 1),
             "last_updated": datetime.now().strftime("%B %d, %Y at %I:%M %p"),
         }
 
-    def get_performance_rating(self, efficiency: float) -> str:
+    @staticmethod
+    def get_performance_rating(efficiency: float) -> str:
         """Get performance rating based on efficiency percentage"""
         if efficiency >= 80:
             return "Excellent"
@@ -299,7 +459,8 @@ class WindFarmDashboard:
         else:
             return "Low"
 
-    def get_country_performance_level(self, capacity_factor: float) -> str:
+    @staticmethod
+    def get_country_performance_level(capacity_factor: float) -> str:
         """Get performance level for countries based on capacity factor"""
         if capacity_factor >= 70:
             return "Excellent"
@@ -310,7 +471,8 @@ class WindFarmDashboard:
         else:
             return "Low"
 
-    def get_empty_dashboard_data(self) -> dict[str, Any]:
+    @staticmethod
+    def get_empty_dashboard_data() -> dict[str, Any]:
         """Return empty dashboard data structure for error cases"""
         return {
             "wind_farms": [],
@@ -325,6 +487,7 @@ class WindFarmDashboard:
             },
             "status_metrics": {
                 "active_farms": 0,
+                "farms_reporting": 0,
                 "countries": 0,
                 "total_capacity": 0,
                 "last_updated": "No data available",
@@ -332,4 +495,137 @@ class WindFarmDashboard:
         }
 
 
+class WindFarmCard(Mapping):
+    """
+    Dashboard card of a single wind farm
+
+    Behaves like a read-only dict with the card fields, which are formatted
+    only when read, so a render does not build a dict per farm.
+    """
+
+    __slots__ = ("_farm", "_wind_speed", "_estimated_power")
+
+    def __init__(
+        self, farm: WindFarmView, wind_speed: float, estimated_power: float
+    ) -> None:
+        """
+        Initialize the card
+
+        Args:
+            farm: Wind farm stored in the registry
+            wind_speed: Current wind speed in m/s, NaN if missing
+            estimated_power: Estimated power output in MW, NaN if missing
+        """
+        self._farm = farm
+        self._wind_speed = wind_speed
+        self._estimated_power = estimated_power
+
+    @property
+    def name(self) -> str:
+        return self._farm.name
+
+    @property
+    def country(self) -> str:
+        return self._farm.country
+
+    @property
+    def current_wind_speed(self) -> float | str:
+        return _round_or_no_data(self._wind_speed)
+
+    @property
+    def estimated_power(self) -> float | str:
+        return _round_or_no_data(self._estimated_power)
+
+    @property
+    def overall_capacity(self) -> float:
+        return round(self._farm.overall_capacity, 0)
+
+    @property
+    def number_of_turbines(self) -> int:
+        return self._farm.number_of_turbines
+
+    @property
+    def efficiency(self) -> float | str:
+        return _round_or_no_data(self._get_efficiency())
+
+    @property
+    def performance_rating(self) -> str:
+        efficiency = self._get_efficiency()
+        if np.isnan(efficiency):
+            return _NO_DATA_SYMBOL
+        return WindFarmDashboard.get_performance_rating(efficiency)
+
+    @property
+    def progress_width(self) -> float | str:
+        efficiency = self._get_efficiency()
+        if np.isnan(efficiency):
+            return _NO_DATA_SYMBOL
+        return min(round(efficiency, 1), 100)
+
+    def _get_efficiency(self) -> float:
+        """Estimated power as a percentage of capacity, NaN if missing"""
+        overall_capacity = self._farm.overall_capacity
+        if np.isnan(self._estimated_power):
+            return np.nan
+        if overall_capacity <= 0:
+            return 0.0
+        return self._estimated_power / overall_capacity * 100
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _CARD_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_CARD_FIELDS)
+
+    def __len__(self) -> int:
+        return len(_CARD_FIELDS)
+
+    def __repr__(self) -> str:
+        return f"WindFarmCard({dict(self)!r})"
+
+
 _NO_DATA_SYMBOL = "-"  # Symbol for missing data in templates
+
+_CARD_FIELDS = (
+    "name",
+    "country",
+    "current_wind_speed",
+    "estimated_power",
+    "overall_capacity",
+    "number_of_turbines",
+    "efficiency",
+    "performance_rating",
+    "progress_width",
+)
+
+CO2_AVOIDED_PER_MWH = 0.82  # tons CO2
+AVERAGE_HOME_CONSUMPTION_KW = 2.5
+
+# Power curve of `calculate_turbine_power` as points for linear interpolation
+_POWER_CURVE_SPEEDS = np.array([3.0, 4.0, 6.0, 8.0, 10.0, 12.0])  # m/s
+_POWER_CURVE_FACTORS = np.array([0.0, 0.1, 0.3, 0.6, 0.9, 1.0])
+_CUT_OUT_SPEED = 25.0  # m/s
+
+# Shared by all dashboards in the process, callers of a coalesced computation
+# all get the same result object
+_dashboard_requests = SingleFlight()
+
+# Registries of loaded wind farm data by data source, kept for the process lifetime
+_MAX_WIND_FARM_REGISTRIES = 8
+_wind_farm_registries: dict[Hashable, WindFarmRegistry] = {}
+_wind_farm_registries_lock = threading.Lock()
+
+
+def _to_wind_speed_array(wind_speeds: Iterable[float | None]) -> np.ndarray:
+    """Convert wind speeds into a float array with NaN for missing values"""
+    return np.array(
+        [np.nan if wind_speed is None else wind_speed for wind_speed in wind_speeds],
+        dtype=float,
+    )
+
+
+def _round_or_no_data(value: float) -> float | str:
+    """Round a value for display, NaN is shown as missing data"""
+    return _NO_DATA_SYMBOL if np.isnan(value) else round(value, 1)
@@ -0,0 +1,248 @@
+"""
+Wind Farm Registry Module
+
+Compact, long-lived in-memory storage for wind farm data. Instead of keeping
+a DataFrame with object-dtype string columns and a list of per-farm dicts,
+the registry stores each column in a compact form:
+
+- ID, Name: tuples of interned strings, unique per farm
+- Country: categorical codes pointing at interned country names
+- Overall capacity, Latitude, Longitude: float32 arrays
+- Number of turbines: int32 array
+
+Individual farms are exposed through lightweight `WindFarmView` objects
+which are created lazily and only hold a reference to the registry and a row index.
+Whole columns are exposed as read-only arrays for vectorized calculations.
+
+Example:
+    registry = WindFarmRegistry.from_dataframe(wind_farm_data)
+    for farm in registry:
+        print(farm.name, farm.overall_capacity)
+    log(f"Registry uses {registry.memory_footprint()} bytes")
+"""
+
+import sys
+from collections.abc import Iterator
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+
+class WindFarmRegistry:
+    """Column-oriented, typed storage for wind farm data"""
+
+    __slots__ = (
+        "_ids",
+        "_names",
+        "_country_codes",
+        "_country_categories",
+        "_overall_capacities",
+        "_numbers_of_turbines",
+        "_latitudes",
+        "_longitudes",
+    )
+
+    def __init__(
+        self,
+        *,
+        ids: list[str],
+        names: list[str],
+        countries: list[str],
+        overall_capacities: list[float],
+        numbers_of_turbines: list[int],
+        latitudes: list[float],
+        longitudes: list[float],
+    ) -> None:
+        """
+        Initialize the registry from column values
+
+        Args:
+            ids: Unique identifiers of wind farms
+            names: Wind farm names
+            countries: Wind farm countries
+            overall_capacities: Total capacities in MW
+            numbers_of_turbines: Counts of turbines
+            latitudes: Geographic latitudes
+            longitudes: Geographic longitudes
+        """
+        self._ids = _intern_strings(ids)
+        self._names = _intern_strings(names)
+        self._country_codes, self._country_categories = _encode_categorical(countries)
+        self._overall_capacities = _read_only_array(overall_capacities, np.float32)
+        self._numbers_of_turbines = _read_only_array(numbers_of_turbines, np.int32)
+        self._latitudes = _read_only_array(latitudes, np.float32)
+        self._longitudes = _read_only_array(longitudes, np.float32)
+
+    @classmethod
+    def from_dataframe(cls, wind_farm_data: pd.DataFrame) -> "WindFarmRegistry":
+        """
+        Build the registry from a DataFrame loaded by a wind farm service
+
+        Args:
+            wind_farm_data: DataFrame with the columns described in `WindFarmServiceExcel`
+
+        Returns:
+            Registry holding a compact copy of the data
+        """
+        return cls(
+            ids=wind_farm_data["ID"].tolist(),
+            names=wind_farm_data["Name"].tolist(),
+            countries=wind_farm_data["Country"].tolist(),
+            overall_capacities=wind_farm_data["Overall capacity"].to_numpy(),
+            numbers_of_turbines=wind_farm_data["Number of turbines"].to_numpy(),
+            latitudes=wind_farm_data["Latitude"].to_numpy(),
+            longitudes=wind_farm_data["Longitude"].to_numpy(),
+        )
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Convert the registry back into a DataFrame with a categorical Country column"""
+        return pd.DataFrame(
+            {
+                "ID": list(self._ids),
+                "Name": list(self._names),
+                "Overall capacity": self._overall_capacities,
+                "Number of turbines": self._numbers_of_turbines,
+                "Country": _decode_categorical(
+                    self._country_codes, self._country_categories
+                ),
+                "Latitude": self._latitudes,
+                "Longitude": self._longitudes,
+            }
+        )
+
+    def memory_footprint(self) -> int:
+        """
+        Estimate memory used by the registry data
+
+        Returns:
+            Number of bytes held by the typed arrays and the interned strings
+        """
+        arrays = (
+            self._country_codes,
+            self._overall_capacities,
+            self._numbers_of_turbines,
+            self._latitudes,
+            self._longitudes,
+        )
+        strings = (self._ids, self._names, self._country_categories)
+        return sum(array.nbytes for array in arrays) + sum(
+            sys.getsizeof(values) + sum(sys.getsizeof(value) for value in values)
+            for values in strings
+        )
+
+    @property
+    def countries(self) -> tuple[str, ...]:
+        """Distinct countries present in the registry, sorted by name"""
+        return self._country_categories
+
+    @property
+    def country_codes(self) -> np.ndarray:
+        """Index of each farm's country in `countries`"""
+        return self._country_codes
+
+    @property
+    def overall_capacities(self) -> np.ndarray:
+        """Total capacities in MW"""
+        return self._overall_capacities
+
+    @property
+    def latitudes(self) -> np.ndarray:
+        return self._latitudes
+
+    @property
+    def longitudes(self) -> np.ndarray:
+        return self._longitudes
+
+    def __len__(self) -> int:
+        return len(self._overall_capacities)
+
+    def __getitem__(self, index: int) -> "WindFarmView":
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Wind farm index out of range")
+        return WindFarmView(self, index)
+
+    def __iter__(self) -> Iterator["WindFarmView"]:
+        for index in range(len(self)):
+            yield WindFarmView(self, index)
+
+
+class WindFarmView:
+    """Read-only view of a single wind farm stored in a `WindFarmRegistry`"""
+
+    __slots__ = ("_registry", "_index")
+
+    def __init__(self, registry: WindFarmRegistry, index: int) -> None:
+        self._registry = registry
+        self._index = index
+
+    @property
+    def id(self) -> str:
+        return self._registry._ids[self._index]
+
+    @property
+    def name(self) -> str:
+        return self._registry._names[self._index]
+
+    @property
+    def country(self) -> str:
+        registry = self._registry
+        return registry._country_categories[registry._country_codes[self._index]]
+
+    @property
+    def overall_capacity(self) -> float:
+        return float(self._registry._overall_capacities[self._index])
+
+    @property
+    def number_of_turbines(self) -> int:
+        return int(self._registry._numbers_of_turbines[self._index])
+
+    # Coordinates are rounded to the about 1 m precision kept by float32,
+    # so 56.6 reads back as 56.6 and not as 56.599998474121094
+    @property
+    def latitude(self) -> float:
+        return round(
+            float(self._registry._latitudes[self._index]), _COORDINATE_DECIMALS
+        )
+
+    @property
+    def longitude(self) -> float:
+        return round(
+            float(self._registry._longitudes[self._index]), _COORDINATE_DECIMALS
+        )
+
+    def __repr__(self) -> str:
+        return f"WindFarmView(id={self.id!r}, name={self.name!r})"
+
+
+_COORDINATE_DECIMALS = 5
+
+
+def _intern_strings(values: list[str]) -> tuple[str, ...]:
+    """Store strings in an immutable tuple, sharing equal strings"""
+    return tuple(
+        sys.intern(str(value)) if not pd.isna(value) else "Unknown" for value in values
+    )
+
+
+def _read_only_array(values: Any, dtype: Any) -> np.ndarray:
+    """Typed array which cannot be modified by code sharing the registry"""
+    array = np.array(values, dtype=dtype)
+    array.flags.writeable = False
+    return array
+
+
+def _encode_categorical(values: list[str]) -> tuple[np.ndarray, tuple[str, ...]]:
+    """Encode strings as smallest-possible integer codes and interned categories"""
+    categorical = pd.Categorical(pd.Series(values, dtype=object).fillna("Unknown"))
+    categories = tuple(sys.intern(str(value)) for value in categorical.categories)
+    return _read_only_array(categorical.codes, categorical.codes.dtype), categories
+
+
+def _decode_categorical(
+    codes: np.ndarray, categories: tuple[str, ...]
+) -> pd.Categorical:
+    """Decode integer codes back into a pandas categorical"""
+    return pd.Categorical.from_codes(codes, categories=list(categories))
@@ -16,6 +16,7 @@ The Excel file should contain columns:
 """
 
 import os
+from collections.abc import Hashable
 
 import pandas as pd
 
@@ -35,6 +36,15 @@ class WindFarmServiceExcel(AbstractWindFarmService):
         """
         self.data_file_path = data_file_path
 
+    @property
+    def source_key(self) -> Hashable:
+        """Excel services reading the same version of a file load the same data"""
+        try:
+            modified_at = os.path.getmtime(self.data_file_path)
+        except OSError:
+            modified_at = None
+        return ("excel", os.path.abspath(self.data_file_path), modified_at)
+
     def load_wind_farm_data(self) -> pd.DataFrame:
         """
         Load wind farm data from Excel file with proper column types
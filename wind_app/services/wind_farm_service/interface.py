@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Hashable
 
 import pandas as pd
 
@@ -6,6 +7,12 @@ import pandas as pd
 class AbstractWindFarmService(ABC):
     """Abstract base class for wind farm services."""
 
+    @property
+    def source_key(self) -> Hashable:
+        """Key identifying the data source, services with equal keys load the same data."""
+        # The service itself rather than its id, which is reused once it is collected
+        return self
+
     @abstractmethod
     def load_wind_farm_data(self) -> pd.DataFrame:
         """Get data frame with wind farm information."""